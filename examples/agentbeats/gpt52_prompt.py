@@ -41,3 +41,12 @@ Apply these priority rules:
 **Avoid violations**: One hard constraint violation fails the entire episode
 
 Now apply ReACT reasoning to each observation and return optimal queue management decisions."""
+
+# Sent first in every request so the prompt is a cacheable prefix
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": [
+        {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+    ],
+}
+PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
@@ -1,10 +1,20 @@
 """GPT-5.2 purple agent for QBench with AgentBeats (A2A protocol)."""
 
 import os
+import asyncio
+import hashlib
 import logging
+import signal
+import socket
 import subprocess
 import time
+from typing import Final
 import uvicorn
+import orjson
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
 from litellm import completion
 
 from a2a.server.apps import A2AStarletteApplication
@@ -14,11 +24,30 @@ from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.types import AgentCard, AgentSkill, AgentCapabilities
 from a2a.utils import new_agent_text_message
+from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH, PREV_AGENT_CARD_WELL_KNOWN_PATH
 
-from gpt52_prompt import SYSTEM_PROMPT
+from qbench.io import read_json_stream
+
+from gpt52_prompt import (
+    SYSTEM_MESSAGE,
+    PROMPT_CACHING_HEADERS,
+)
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Published when the LLM fails or sends back nothing
+_NOOP: Final[str] = '{"type": "noop"}'
+
+# Keep idle green-agent connections open across LLM turns; must exceed the
+# client's keepalive_expiry (60s in agentbeats.client)
+KEEP_ALIVE_TIMEOUT = 75
+
 
 class GPT52AgentExecutor(AgentExecutor):
     """
@@ -42,6 +71,8 @@ class GPT52AgentExecutor(AgentExecutor):
         self.model = model
         self.temperature = temperature
         self.api_key = os.getenv("OPENAI_API_KEY")
+        # Claude routes need the caching beta header; OpenAI caches prefixes automatically
+        self.extra_headers = PROMPT_CACHING_HEADERS if "claude" in model.lower() else None
 
         if not self.api_key:
             raise ValueError(
@@ -66,25 +97,28 @@ class GPT52AgentExecutor(AgentExecutor):
         observation_text = context.get_user_input()
 
         try:
-            # Call GPT-5.2 via litellm
+            # Call GPT-5.2 via litellm (streamed to cut time-to-first-token)
             response = completion(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
+                    SYSTEM_MESSAGE,
                     {"role": "user", "content": observation_text}
                 ],
                 temperature=self.temperature,
-                api_key=self.api_key
+                api_key=self.api_key,
+                extra_headers=self.extra_headers,
+                stream=True
             )
 
-            # Extract response
-            llm_response = response.choices[0].message.content
+            # Accumulate response; published as a single message because the
+            # green agent reads one event per non-streaming send
+            llm_response = read_json_stream(response) or _NOOP
             logger.info(f"GPT-5.2 response: {llm_response[:100]}...")
 
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
             # Return empty actions on error
-            llm_response = '{"type": "noop"}'
+            llm_response = _NOOP
 
         # Publish response to event queue
         response_message = new_agent_text_message(
@@ -127,8 +161,50 @@ def create_agent_card(base_url: str) -> AgentCard:
     )
 
 
-def kill_process_on_port(port: int) -> None:
-    """Kill any process using the specified port and wait for release."""
+def _port_is_free(host: str, port: int) -> bool:
+    """Return True if host:port can be bound right now."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((host, port))
+        except OSError:
+            return False
+    return True
+
+
+def agent_card_routes(card: AgentCard) -> list[Route]:
+    """
+    Routes serving the agent card from bytes serialized once at startup.
+
+    The card never changes while the server runs, so discovery probes skip
+    the per-request model dump and get an ETag for conditional requests.
+    """
+    card_bytes = orjson.dumps(card.model_dump(mode="json", exclude_none=True, by_alias=True))
+    etag = f'"{hashlib.blake2b(card_bytes, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag}
+
+    async def get_agent_card(request: Request) -> Response:
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(card_bytes, media_type="application/json", headers=headers)
+
+    return [
+        Route(path, get_agent_card, methods=["GET"])
+        for path in (AGENT_CARD_WELL_KNOWN_PATH, PREV_AGENT_CARD_WELL_KNOWN_PATH)
+    ]
+
+
+def kill_process_on_port(port: int, host: str = "0.0.0.0") -> bool:
+    """Kill any process using the specified port.
+
+    Returns:
+        True if processes were killed and the port may still be releasing
+    """
+    # Fast path: a successful bind means nothing is listening, no subprocess needed
+    if _port_is_free(host, port):
+        print(f"No existing process found on port {port}")
+        return False
+
     try:
         # Find process using the port
         result = subprocess.run(
@@ -136,51 +212,32 @@ def kill_process_on_port(port: int) -> None:
             capture_output=True,
             text=True
         )
-        if result.stdout.strip():
-            pids = result.stdout.strip().split('\n')
-            for pid in pids:
-                print(f"Killing existing process on port {port} (PID: {pid})...")
-                subprocess.run(["kill", "-9", pid], check=True)
-                print(f"Process {pid} killed")
-
-            # Wait for port to be released
-            print(f"Waiting for port {port} to be released...")
-            time.sleep(2)
-
-            # Verify port is free
-            check_result = subprocess.run(
-                ["lsof", "-ti", f":{port}"],
-                capture_output=True,
-                text=True
-            )
-            if check_result.stdout.strip():
-                print(f"Warning: Port {port} still in use, waiting longer...")
-                time.sleep(2)
-            else:
-                print(f"Port {port} is now free")
-        else:
-            print(f"No existing process found on port {port}")
+        for pid in result.stdout.split():
+            print(f"Killing existing process on port {port} (PID: {pid})...")
+            os.kill(int(pid), signal.SIGKILL)
+            print(f"Process {pid} killed")
     except Exception as e:
         print(f"Note: Could not check/kill existing process: {e}")
-
-
-def main():
-    """Run the GPT-5.2 purple agent server."""
-    import argparse
-
-    # Parse command-line arguments
-    parser = argparse.ArgumentParser(description="GPT-5.2 Purple Agent for QBench")
-    parser.add_argument("--host", type=str, default="0.0.0.0", help="Host to bind the server")
-    parser.add_argument("--port", type=int, default=9019, help="Port to bind the server")
-    parser.add_argument("--card-url", type=str, help="Agent card URL (optional, for compatibility)")
-    args = parser.parse_args()
-
-    PORT = args.port
-    HOST = args.host
-
-    # Kill any existing process on this port
-    kill_process_on_port(PORT)
-
+        return False
+    return True
+
+
+async def wait_for_port_release(port: int, host: str = "0.0.0.0", timeout: float = 4.0) -> None:
+    """Poll until the port can be bound, backing off from 1ms to 50ms."""
+    print(f"Waiting for port {port} to be released...")
+    delay = 0.001
+    deadline = time.monotonic() + timeout
+    while not _port_is_free(host, port):
+        if time.monotonic() >= deadline:
+            print(f"Warning: Port {port} still in use after {timeout:.0f}s")
+            return
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.05)
+    print(f"Port {port} is now free")
+
+
+def build_app(host: str, port: int) -> tuple[GPT52AgentExecutor, Starlette]:
+    """Create the executor and the A2A Starlette app serving it."""
     # Create executor
     executor = GPT52AgentExecutor()
 
@@ -192,7 +249,7 @@ def main():
 
     # Create agent card
     # Use HOST:PORT for agent card URL (works in Docker and locally)
-    card = create_agent_card(f"http://{HOST}:{PORT}")
+    card = create_agent_card(f"http://{host}:{port}")
 
     # Create app
     a2a_app = A2AStarletteApplication(
@@ -200,15 +257,49 @@ def main():
         http_handler=request_handler
     )
 
-    # Build the Starlette app
+    # Build the Starlette app, shadowing the SDK's card handler with the cached one
     app = a2a_app.build()
+    app.router.routes[:0] = agent_card_routes(card)
+    return executor, app
+
+
+async def serve(host: str, port: int) -> None:
+    """Free the port and build the app concurrently, then run the server."""
+    # Kill any existing process on this port
+    if kill_process_on_port(port, host):
+        # Build the app while the killed process releases the port
+        _, (executor, app) = await asyncio.gather(
+            wait_for_port_release(port, host),
+            asyncio.to_thread(build_app, host, port),
+        )
+    else:
+        executor, app = build_app(host, port)
 
-    print(f"Starting GPT-5.2 purple agent on {HOST}:{PORT}...")
-    print(f"Agent URL: http://{HOST}:{PORT}")
+    print(f"Starting GPT-5.2 purple agent on {host}:{port}...")
+    print(f"Agent URL: http://{host}:{port}")
     print(f"Model: {executor.model}, Temperature: {executor.temperature}")
 
-    # Run server
-    uvicorn.run(app, host=HOST, port=PORT)
+    # Run server on this event loop rather than letting uvicorn create one
+    server = uvicorn.Server(
+        uvicorn.Config(app, host=host, port=port, timeout_keep_alive=KEEP_ALIVE_TIMEOUT)
+    )
+    await server.serve()
+
+
+def main():
+    """Run the GPT-5.2 purple agent server."""
+    import argparse
+
+    # Parse command-line arguments
+    parser = argparse.ArgumentParser(description="GPT-5.2 Purple Agent for QBench")
+    parser.add_argument("--host", type=str, default="0.0.0.0", help="Host to bind the server")
+    parser.add_argument("--port", type=int, default=9019, help="Port to bind the server")
+    parser.add_argument("--card-url", type=str, help="Agent card URL (optional, for compatibility)")
+    args = parser.parse_args()
+
+    # libuv-backed loop when available; uvicorn picks httptools on its own
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+    asyncio.run(serve(args.host, args.port), loop_factory=loop_factory)
 
 
 if __name__ == "__main__":
@@ -1,29 +1,51 @@
 """Minimal GPT-5.2 agent for QBench standalone mode."""
 
 import os
+import hashlib
 import logging
-from litellm import completion
+import threading
+from collections import OrderedDict
+from typing import Final
+from litellm import acompletion, completion
 
 from qbench import Agent
-from .prompt import SYSTEM_PROMPT
+from qbench.io import read_json_stream
+from .prompt import SYSTEM_MESSAGE, PROMPT_CACHING_HEADERS
 
 logger = logging.getLogger(__name__)
 
+# Returned (never cached) when the LLM fails or sends back nothing
+_EMPTY_ACTIONS: Final[str] = '{"assign": [], "reject": [], "cancel": []}'
+
+# Header of the formatted queue state; task instructions may precede it
+_STATE_HEADER: Final[str] = "QUEUE STATUS"
+
 
 class GPT52Agent(Agent):
     """
     Simple GPT-5.2 agent for queue management.
 
     Uses litellm to call GPT-5.2 and returns raw LLM responses.
+    An optional response cache, keyed by queue state, lets identical states
+    skip the LLM round-trip. Caching replays the first sampled response for
+    a state, so runs with it enabled are deterministic rather than sampled.
     """
 
-    def __init__(self, model: str = "gpt-5.2-2025-12-11", temperature: float = 1.0):
+    def __init__(
+        self,
+        model: str = "gpt-5.2-2025-12-11",
+        temperature: float = 1.0,
+        cache_size: int = 0
+    ):
         """
         Initialize GPT-5.2 agent.
 
         Args:
             model: OpenAI model name (default: gpt-5.2-2025-12-11)
             temperature: Sampling temperature for LLM (default: 1.0, required by GPT-5.2)
+            cache_size: Maximum cached responses; 0 disables caching (default: 0).
+                When enabled, repeated states reuse one sample instead of
+                drawing a fresh one at this temperature
 
         Raises:
             ValueError: If OPENAI_API_KEY environment variable is not set
@@ -31,6 +53,13 @@ class GPT52Agent(Agent):
         self.model = model
         self.temperature = temperature
         self.api_key = os.getenv("OPENAI_API_KEY")
+        # Claude routes need the caching beta header; OpenAI caches prefixes automatically
+        self.extra_headers = PROMPT_CACHING_HEADERS if "claude" in model.lower() else None
+
+        # LRU response cache keyed by state digest (act() may run on many threads)
+        self.cache_size = cache_size
+        self._cache: OrderedDict[bytes, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
         if not self.api_key:
             raise ValueError(
@@ -40,6 +69,38 @@ class GPT52Agent(Agent):
 
         logger.info(f"Initialized GPT-5.2 agent with model: {model}")
 
+    def _cache_key(self, observation_text: str) -> bytes | None:
+        """
+        Digest the queue state in observation_text, or return None if caching is off.
+
+        Only the lines of the QUEUE STATUS block count, with separators and
+        indentation dropped, so instructions sent ahead of the state do not
+        split cache entries.
+        """
+        if self.cache_size <= 0:
+            return None
+        start = observation_text.rfind(_STATE_HEADER)
+        state = observation_text[start:] if start >= 0 else observation_text
+        lines = (line.strip() for line in state.splitlines())
+        canonical = "\n".join(line for line in lines if line and not line.startswith("="))
+        return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> str | None:
+        """Return cached response for key, marking it most recently used."""
+        with self._cache_lock:
+            response = self._cache.get(key)
+            if response is not None:
+                self._cache.move_to_end(key)
+            return response
+
+    def _cache_put(self, key: bytes, response: str) -> None:
+        """Store response, evicting the least recently used entry if full."""
+        with self._cache_lock:
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
     def act(self, observation_text: str) -> str:
         """
         Receive observation and return actions via LLM.
@@ -50,23 +111,75 @@ class GPT52Agent(Agent):
         Returns:
             LLM response as string (will be parsed by QBench)
         """
+        key = self._cache_key(observation_text)
+        if key is not None:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
         try:
-            # Call GPT-5.2 via litellm
+            # Call GPT-5.2 via litellm (streamed to cut time-to-first-token)
             response = completion(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
+                    SYSTEM_MESSAGE,
                     {"role": "user", "content": observation_text}
                 ],
                 temperature=self.temperature,
-                api_key=self.api_key
+                api_key=self.api_key,
+                extra_headers=self.extra_headers,
+                stream=True
             )
 
-            # Extract and return response
+            # Accumulate and return response
+            llm_response = read_json_stream(response)
+            if not llm_response:
+                return _EMPTY_ACTIONS
+            if key is not None:
+                self._cache_put(key, llm_response)
+            return llm_response
+
+        except Exception as e:
+            logger.error(f"LLM call failed: {e}")
+            # Return empty actions on error
+            return _EMPTY_ACTIONS
+
+    async def aact(self, observation_text: str) -> str:
+        """
+        Async variant of act() so parallel episodes share one event loop.
+
+        Args:
+            observation_text: Formatted observation from environment
+
+        Returns:
+            LLM response as string (will be parsed by QBench)
+        """
+        key = self._cache_key(observation_text)
+        if key is not None:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        try:
+            response = await acompletion(
+                model=self.model,
+                messages=[
+                    SYSTEM_MESSAGE,
+                    {"role": "user", "content": observation_text}
+                ],
+                temperature=self.temperature,
+                api_key=self.api_key,
+                extra_headers=self.extra_headers,
+                stream=False
+            )
             llm_response = response.choices[0].message.content
+            if not llm_response:
+                return _EMPTY_ACTIONS
+            if key is not None:
+                self._cache_put(key, llm_response)
             return llm_response
 
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
             # Return empty actions on error
-            return '{"assign": [], "reject": [], "cancel": []}'
+            return _EMPTY_ACTIONS
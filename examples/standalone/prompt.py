@@ -4,3 +4,12 @@ SYSTEM_PROMPT = """You are a queue management agent.
 
 You will receive observations about the current queue state at each time step.
 Follow the instructions provided with each observation and respond accordingly."""
+
+# Sent first in every request so the prompt is a cacheable prefix
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": [
+        {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+    ],
+}
+PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
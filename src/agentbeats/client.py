@@ -1,9 +1,10 @@
 import asyncio
-import json
 import logging
+from typing import Any
 from uuid import uuid4
 
 import httpx
+import orjson
 from a2a.client import (
     A2ACardResolver,
     ClientConfig,
@@ -26,6 +27,31 @@ DEFAULT_TIMEOUT = httpx.Timeout(
     pool=30.0       # 30 seconds to get connection from pool
 )
 
+# Idle connections must outlive an LLM turn (often >5s, httpx's default expiry)
+# or every step reconnects. Kept below the purple agent's server-side timeout
+# so the client always drops a connection before the server does.
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=60.0,
+)
+
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def create_httpx_client() -> httpx.AsyncClient:
+    """Create a pooled client meant to be reused across send_message calls."""
+    return httpx.AsyncClient(
+        timeout=DEFAULT_TIMEOUT,
+        limits=DEFAULT_LIMITS,
+        http2=HTTP2_AVAILABLE,
+    )
+
 
 def create_message(*, role: Role = Role.user, text: str, context_id: str | None = None) -> Message:
     return Message(
@@ -42,50 +68,59 @@ def merge_parts(parts: list[Part]) -> str:
         if isinstance(part.root, TextPart):
             chunks.append(part.root.text)
         elif isinstance(part.root, DataPart):
-            chunks.append(json.dumps(part.root.data, indent=2))
+            chunks.append(orjson.dumps(part.root.data, option=orjson.OPT_INDENT_2).decode())
     return "\n".join(chunks)
 
-async def send_message(message: str, base_url: str, context_id: str | None = None, streaming=False, consumer: Consumer | None = None):
-    """Returns dict with context_id, response and status (if exists)"""
-    async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as httpx_client:
-        resolver = A2ACardResolver(httpx_client=httpx_client, base_url=base_url)
-        agent_card = await resolver.get_agent_card()
-        config = ClientConfig(
-            httpx_client=httpx_client,
-            streaming=streaming,
-        )
-        factory = ClientFactory(config)
-        client = factory.create(agent_card)
-        if consumer:
-            await client.add_event_consumer(consumer)
-
-        outbound_msg = create_message(text=message, context_id=context_id)
-        last_event = None
-        outputs = {
-            "response": "",
-            "context_id": None
-        }
-
-        # if streaming == False, only one event is generated
-        async for event in client.send_message(outbound_msg):
-            last_event = event
-
-        match last_event:
-            case Message() as msg:
-                outputs["context_id"] = msg.context_id
-                outputs["response"] += merge_parts(msg.parts)
+async def send_message(message: str, base_url: str, context_id: str | None = None, streaming: bool = False, consumer: Consumer | None = None, httpx_client: httpx.AsyncClient | None = None) -> dict[str, Any]:
+    """Returns dict with context_id, response and status (if exists)
 
-            case (task, update):
-                outputs["context_id"] = task.context_id
-                outputs["status"] = task.status.state.value
-                msg = task.status.message
-                if msg:
-                    outputs["response"] += merge_parts(msg.parts)
-                if task.artifacts:
-                    for artifact in task.artifacts:
-                        outputs["response"] += merge_parts(artifact.parts)
+    Pass a long-lived httpx_client to reuse pooled connections across calls;
+    otherwise a client is created and closed for this call only.
+    """
+    if httpx_client is None:
+        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as owned_client:
+            return await _send_message(message, base_url, context_id, streaming, consumer, owned_client)
+    return await _send_message(message, base_url, context_id, streaming, consumer, httpx_client)
+
+async def _send_message(message: str, base_url: str, context_id: str | None, streaming: bool, consumer: Consumer | None, httpx_client: httpx.AsyncClient) -> dict[str, Any]:
+    resolver = A2ACardResolver(httpx_client=httpx_client, base_url=base_url)
+    agent_card = await resolver.get_agent_card()
+    config = ClientConfig(
+        httpx_client=httpx_client,
+        streaming=streaming,
+    )
+    factory = ClientFactory(config)
+    client = factory.create(agent_card)
+    if consumer:
+        await client.add_event_consumer(consumer)
+
+    outbound_msg = create_message(text=message, context_id=context_id)
+    last_event = None
+    outputs: dict[str, Any] = {
+        "response": "",
+        "context_id": None
+    }
+
+    # if streaming == False, only one event is generated
+    async for event in client.send_message(outbound_msg):
+        last_event = event
+
+    match last_event:
+        case Message() as msg:
+            outputs["context_id"] = msg.context_id
+            outputs["response"] += merge_parts(msg.parts)
+
+        case (task, update):
+            outputs["context_id"] = task.context_id
+            outputs["status"] = task.status.state.value
+            msg = task.status.message
+            if msg:
+                outputs["response"] += merge_parts(msg.parts)
+            if task.artifacts:
+                for artifact in task.artifacts:
+                    outputs["response"] += merge_parts(artifact.parts)
 
-            case _:
-                pass
+        case _:
+            pass
 
-        return outputs
+    return outputs
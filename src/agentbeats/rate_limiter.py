@@ -7,12 +7,19 @@ swapped with different rate limiting strategies.
 import asyncio
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Awaitable
+from typing import Any, Callable, Awaitable, NamedTuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class _Result(NamedTuple):
+    """Outcome of a queued request, delivered through its response future."""
+
+    value: Any = None
+    error: Exception | None = None
+
+
 class RateLimiterBase(ABC):
     """Abstract base class for rate limiters.
 
@@ -30,65 +37,112 @@ class RateLimiterBase(ABC):
         """Reset the rate limiter state."""
         pass
 
+    def can_acquire_now(self) -> bool:
+        """Return True if acquire() would return without waiting.
+
+        Non-blocking and side-effect free. Used by RequestQueueManager to
+        bypass the queue when uncontended; the conservative default keeps
+        every request on the queue path.
+        """
+        return False
+
 
 class RPMLimiter(RateLimiterBase):
     """Requests Per Minute (RPM) rate limiter.
 
-    Enforces a fixed number of requests per minute by spacing them evenly.
-    Example: 50 RPM = 1 request every 1.2 seconds
+    Token bucket refilled at requests_per_minute / 60 tokens per second.
+    Bursts up to `capacity` requests are released immediately; once the
+    bucket is empty callers wait only for the next token.
+    Example: 50 RPM = 1 new token every 1.2 seconds
     """
 
-    def __init__(self, requests_per_minute: int):
+    def __init__(self, requests_per_minute: int, capacity: int | None = None):
         """Initialize RPM limiter.
 
         Args:
             requests_per_minute: Maximum requests allowed per minute
+            capacity: Maximum burst size (default: requests_per_minute)
         """
         self.requests_per_minute = requests_per_minute
-        self.delay_between_requests = 60.0 / requests_per_minute  # seconds
-        self.last_request_time = 0.0
-        self._lock = asyncio.Lock()
+        self.delay_between_requests = 60.0 / requests_per_minute  # seconds per token
+        self.capacity = capacity if capacity is not None else requests_per_minute
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
 
         logger.info(
             f"[RATE LIMITER] Initialized: {requests_per_minute} RPM "
-            f"({self.delay_between_requests:.2f}s between requests)"
+            f"({self.delay_between_requests:.2f}s per token, burst {self.capacity})"
+        )
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill, capped at capacity."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.last_refill) / self.delay_between_requests
         )
+        self.last_refill = now
+
+    def can_acquire_now(self) -> bool:
+        """Return True if a token is available right now."""
+        self._refill()
+        return self.tokens >= 1
 
     async def acquire(self) -> None:
-        """Wait until next request slot is available."""
-        async with self._lock:
-            now = time.time()
-            time_since_last = now - self.last_request_time
+        """Wait until a token is available, then consume it.
 
-            if time_since_last < self.delay_between_requests:
-                wait_time = self.delay_between_requests - time_since_last
-                logger.debug(f"[RATE LIMITER] Waiting {wait_time:.2f}s...")
-                await asyncio.sleep(wait_time)
+        Refill and decrement never await, so no lock is needed and waiting
+        callers do not serialize each other.
+        """
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
 
-            self.last_request_time = time.time()
+            wait_time = (1 - self.tokens) * self.delay_between_requests
+            logger.debug(f"[RATE LIMITER] Waiting {wait_time:.2f}s...")
+            await asyncio.sleep(wait_time)
 
     def reset(self) -> None:
         """Reset the rate limiter state."""
-        self.last_request_time = 0.0
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
         logger.info("[RATE LIMITER] Reset")
 
 
 class RequestQueueManager:
     """Manages a request queue with pluggable rate limiting.
 
-    Processes requests in FIFO order while enforcing rate limits.
-    Requests are function calls that return awaitable results.
+    Admits requests in FIFO order while enforcing rate limits. Admitted
+    requests run concurrently (up to max_inflight), so a slow request does
+    not hold up the ones queued behind it.
+    Requests are function calls that return awaitable results. When the
+    queue is empty and both a slot and a rate-limit token are free, a
+    request runs directly in the caller's task without being queued.
     """
 
-    def __init__(self, rate_limiter: RateLimiterBase):
+    def __init__(
+        self,
+        rate_limiter: RateLimiterBase,
+        max_inflight: int = 10,
+        request_timeout: float | None = None
+    ):
         """Initialize queue manager with rate limiter.
 
         Args:
             rate_limiter: Rate limiter instance to control request rate
+            max_inflight: Maximum number of requests executing at once
+            request_timeout: Seconds before a running request is cancelled
+                with TimeoutError (default: no limit)
         """
         self.rate_limiter = rate_limiter
+        self.max_inflight = max_inflight
+        self.request_timeout = request_timeout
         self.queue: asyncio.Queue = asyncio.Queue()
         self._worker_task: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+        self._inflight_slots = asyncio.Semaphore(max_inflight)
         self._running = False
 
         logger.info("[QUEUE MANAGER] Initialized")
@@ -104,18 +158,30 @@ class RequestQueueManager:
         logger.info("[QUEUE MANAGER] Started worker")
 
     async def stop(self) -> None:
-        """Stop the queue processing worker."""
+        """Stop the queue processing worker.
+
+        The worker and all in-flight requests are cancelled together, so
+        shutdown never waits on a slow call. Requests still queued are
+        cancelled so their callers do not wait forever.
+        """
         if not self._running:
             return
 
         self._running = False
 
+        tasks = [*self._inflight]
         if self._worker_task:
-            self._worker_task.cancel()
-            try:
-                await self._worker_task
-            except asyncio.CancelledError:
-                pass
+            tasks.append(self._worker_task)
+            self._worker_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Fail requests that were never admitted
+        while not self.queue.empty():
+            _, response_future, _ = self.queue.get_nowait()
+            response_future.cancel()
+            self.queue.task_done()
 
         logger.info("[QUEUE MANAGER] Stopped worker")
 
@@ -133,6 +199,25 @@ class RequestQueueManager:
         Returns:
             Result from request_fn
         """
+        # Fast path: nothing queued ahead of us and no waiting required, so
+        # skip the queue round-trip and future allocation
+        if (
+            self._running
+            and self.queue.empty()
+            and not self._inflight_slots.locked()
+            and self.rate_limiter.can_acquire_now()
+        ):
+            # Neither acquire suspends here, so no other request can slip in
+            await self._inflight_slots.acquire()
+            try:
+                await self.rate_limiter.acquire()
+                if request_id:
+                    logger.debug(f"[QUEUE MANAGER] Fast-path request: {request_id}")
+                async with asyncio.timeout(self.request_timeout):
+                    return await request_fn()
+            finally:
+                self._inflight_slots.release()
+
         # Create future for response
         response_future: asyncio.Future = asyncio.Future()
 
@@ -143,10 +228,13 @@ class RequestQueueManager:
             logger.debug(f"[QUEUE MANAGER] Queued request: {request_id}")
 
         # Wait for response
-        return await response_future
+        result: _Result = await response_future
+        if result.error is not None:
+            raise result.error
+        return result.value
 
     async def _process_queue(self) -> None:
-        """Process requests from queue with rate limiting (FIFO order)."""
+        """Admit requests from queue with rate limiting (FIFO order)."""
         logger.info("[QUEUE MANAGER] Processing queue...")
 
         while self._running:
@@ -157,29 +245,26 @@ class RequestQueueManager:
                 if request_id:
                     logger.debug(f"[QUEUE MANAGER] Processing request: {request_id}")
 
+                # Wait for an execution slot and the rate limit, then dispatch
+                # without awaiting completion
                 try:
-                    # Wait for rate limit
-                    await self.rate_limiter.acquire()
-
-                    # Execute request
-                    result = await request_fn()
-
-                    # Set response
-                    if not response_future.done():
-                        response_future.set_result(result)
-
-                    if request_id:
-                        logger.debug(f"[QUEUE MANAGER] Completed request: {request_id}")
-
-                except Exception as e:
-                    # Set exception on future
-                    if not response_future.done():
-                        response_future.set_exception(e)
-
-                    logger.error(f"[QUEUE MANAGER] Request failed: {e}")
-
-                finally:
+                    await self._inflight_slots.acquire()
+                    try:
+                        await self.rate_limiter.acquire()
+                    except BaseException:
+                        self._inflight_slots.release()
+                        raise
+                except BaseException:
+                    # Never admitted; don't leave the caller waiting
+                    response_future.cancel()
                     self.queue.task_done()
+                    raise
+
+                task = asyncio.create_task(
+                    self._run_request(request_fn, response_future, request_id)
+                )
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
 
             except asyncio.CancelledError:
                 logger.info("[QUEUE MANAGER] Worker cancelled")
@@ -190,6 +275,42 @@ class RequestQueueManager:
 
         logger.info("[QUEUE MANAGER] Worker stopped")
 
+    async def _run_request(
+        self,
+        request_fn: Callable[[], Awaitable[Any]],
+        response_future: asyncio.Future,
+        request_id: str | None
+    ) -> None:
+        """Execute one admitted request and pipe its outcome to the caller's future."""
+        try:
+            # Execute request
+            async with asyncio.timeout(self.request_timeout):
+                result = await request_fn()
+
+            # Set response
+            if not response_future.done():
+                response_future.set_result(_Result(value=result))
+
+            if request_id:
+                logger.debug(f"[QUEUE MANAGER] Completed request: {request_id}")
+
+        except asyncio.CancelledError:
+            if not response_future.done():
+                response_future.cancel()
+            raise
+
+        except Exception as e:
+            # Hand the error back as a value; submit_request re-raises it in
+            # the caller, so an abandoned future never logs an unretrieved error
+            if not response_future.done():
+                response_future.set_result(_Result(error=e))
+
+            logger.error(f"[QUEUE MANAGER] Request failed: {e}")
+
+        finally:
+            self._inflight_slots.release()
+            self.queue.task_done()
+
     @property
     def queue_size(self) -> int:
         """Get current queue size."""
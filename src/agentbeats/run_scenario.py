@@ -33,7 +33,7 @@ async def wait_for_agents(cfg: dict, timeout: int = 30) -> bool:
         return True  # No agents to wait for
 
     print(f"Waiting for {len(endpoints)} agent(s) to be ready...")
-    start_time = time.time()
+    start_time = time.monotonic()
 
     async def check_endpoint(endpoint: str) -> bool:
         """Check if an endpoint is responding by fetching the agent card."""
@@ -46,7 +46,7 @@ async def wait_for_agents(cfg: dict, timeout: int = 30) -> bool:
             # Any exception means the agent is not ready
             return False
 
-    while time.time() - start_time < timeout:
+    while time.monotonic() - start_time < timeout:
         ready_count = 0
         for endpoint in endpoints:
             if await check_endpoint(endpoint):
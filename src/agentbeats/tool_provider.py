@@ -1,4 +1,8 @@
-from agentbeats.client import send_message
+import asyncio
+
+import httpx
+
+from agentbeats.client import create_httpx_client, send_message
 
 # Optional import for rate limiting
 try:
@@ -17,6 +21,25 @@ class ToolProvider:
         """
         self._context_ids = {}
         self._queue_manager = queue_manager
+        # Pooled client, created lazily and bound to the event loop that created it
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_client(self) -> httpx.AsyncClient | None:
+        """
+        Return the pooled client for the running event loop.
+
+        Returns None when the pooled client belongs to a different loop
+        (e.g. calls made via asyncio.run in a worker thread); send_message
+        then falls back to a per-call client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed:
+            self._client = create_httpx_client()
+            self._client_loop = loop
+        elif self._client_loop is not loop:
+            return None
+        return self._client
 
     async def talk_to_agent(self, message: str, url: str, new_conversation: bool = False):
         """
@@ -37,7 +60,8 @@ class ToolProvider:
                 outputs = await send_message(
                     message=message,
                     base_url=url,
-                    context_id=None if new_conversation else self._context_ids.get(url, None)
+                    context_id=None if new_conversation else self._context_ids.get(url, None),
+                    httpx_client=self._get_client()
                 )
                 if outputs.get("status", "completed") != "completed":
                     raise RuntimeError(f"{url} responded with: {outputs}")
@@ -55,7 +79,8 @@ class ToolProvider:
             outputs = await send_message(
                 message=message,
                 base_url=url,
-                context_id=None if new_conversation else self._context_ids.get(url, None)
+                context_id=None if new_conversation else self._context_ids.get(url, None),
+                httpx_client=self._get_client()
             )
             if outputs.get("status", "completed") != "completed":
                 raise RuntimeError(f"{url} responded with: {outputs}")
@@ -66,6 +91,15 @@ class ToolProvider:
         """Reset all cached context IDs."""
         self._context_ids = {}
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client if it belongs to the running loop."""
+        if self._client is not None:
+            # A client bound to another (possibly closed) loop cannot be awaited here
+            if self._client_loop is asyncio.get_running_loop():
+                await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
     def reset_context(self, url: str) -> None:
         """
         Reset context ID for a specific agent URL.
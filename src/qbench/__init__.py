@@ -1,42 +1,91 @@
 """QBench - Queue Management Benchmark for AI Agents."""
 
-# Data models
-from qbench.data_models.action import Action
-from qbench.data_models.observation import Observation, ScheduledTask
-from qbench.data_models.result import BenchmarkResult, EpisodeResult, Metrics
-from qbench.data_models.task import Task
-from qbench.data_models.violation import Violation
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-# Environment
-from qbench.environment.env import QueueEnv
-from qbench.environment.loader import ScenarioLoader, SeedConfig
+if TYPE_CHECKING:
+    # Data models
+    from qbench.data_models.action import Action
+    from qbench.data_models.observation import Observation, ScheduledTask
+    from qbench.data_models.result import BenchmarkResult, EpisodeResult, Metrics
+    from qbench.data_models.task import Task
+    from qbench.data_models.violation import Violation
 
-# Validation
-from qbench.validation.checker import ConstraintChecker
-from qbench.validation.validator import ActionValidator
+    # Environment
+    from qbench.environment.env import QueueEnv
+    from qbench.environment.loader import ScenarioLoader, SeedConfig
 
-# Metrics
-from qbench.metrics.accumulator import MetricsAccumulator
+    # Validation
+    from qbench.validation.checker import ConstraintChecker
+    from qbench.validation.validator import ActionValidator
 
-# IO
-from qbench.io.formatter import ObservationFormatter
-from qbench.io.parser import ActionParser
+    # Metrics
+    from qbench.metrics.accumulator import MetricsAccumulator
 
-# Agent
-from qbench.agent.base import Agent, GreedyAgent, RandomAgent
+    # IO
+    from qbench.io.formatter import ObservationFormatter
+    from qbench.io.parser import ActionParser
+
+    # Agent
+    from qbench.agent.base import Agent, GreedyAgent, RandomAgent
 
-# Runners
-from qbench.runner.benchmark import BenchmarkRunner
-from qbench.runner.episode import EpisodeRunner
+    # Runners
+    from qbench.runner.benchmark import BenchmarkRunner
+    from qbench.runner.episode import EpisodeRunner
 
-# API (new - for easy standalone usage)
-from qbench.api import run_qbench
+    # API (new - for easy standalone usage)
+    from qbench.api import run_qbench
 
-# Scenarios
-from qbench.scenarios import list_scenarios, AVAILABLE_SCENARIOS
+    # Scenarios
+    from qbench.scenarios import list_scenarios, AVAILABLE_SCENARIOS
 
 __version__ = "0.1.0"
 
+# Public name -> defining module. Submodules load on first attribute access, so
+# light entry points (CLI --help, qbench.config) skip the evaluator/A2A chain.
+_EXPORTS = {
+    "Action": "qbench.data_models.action",
+    "Observation": "qbench.data_models.observation",
+    "ScheduledTask": "qbench.data_models.observation",
+    "BenchmarkResult": "qbench.data_models.result",
+    "EpisodeResult": "qbench.data_models.result",
+    "Metrics": "qbench.data_models.result",
+    "Task": "qbench.data_models.task",
+    "Violation": "qbench.data_models.violation",
+    "QueueEnv": "qbench.environment.env",
+    "ScenarioLoader": "qbench.environment.loader",
+    "SeedConfig": "qbench.environment.loader",
+    "ConstraintChecker": "qbench.validation.checker",
+    "ActionValidator": "qbench.validation.validator",
+    "MetricsAccumulator": "qbench.metrics.accumulator",
+    "ObservationFormatter": "qbench.io.formatter",
+    "ActionParser": "qbench.io.parser",
+    "Agent": "qbench.agent.base",
+    "GreedyAgent": "qbench.agent.base",
+    "RandomAgent": "qbench.agent.base",
+    "BenchmarkRunner": "qbench.runner.benchmark",
+    "EpisodeRunner": "qbench.runner.episode",
+    "run_qbench": "qbench.api",
+    "list_scenarios": "qbench.scenarios",
+    "AVAILABLE_SCENARIOS": "qbench.scenarios",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its defining module on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported names."""
+    return sorted({*globals(), *_EXPORTS})
+
+
 __all__ = [
     # Data models
     "Task",
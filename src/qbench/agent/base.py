@@ -1,5 +1,6 @@
 """Base agent interface for QBench."""
 
+import asyncio
 from abc import ABC, abstractmethod
 
 
@@ -69,6 +70,22 @@ class Agent(ABC):
         """
         pass
 
+    async def aact(self, observation_text: str) -> str:
+        """
+        Async variant of act() for callers running many episodes on one event loop.
+
+        The default runs act() in a worker thread. Agents backed by async I/O
+        (e.g. LLM clients) should override this to await the call directly so
+        concurrent episodes share the loop instead of a thread each.
+
+        Args:
+            observation_text: Formatted observation from the environment
+
+        Returns:
+            String containing actions (same contract as act())
+        """
+        return await asyncio.to_thread(self.act, observation_text)
+
 
 class RandomAgent(Agent):
     """
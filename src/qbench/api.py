@@ -1,14 +1,21 @@
 """Simple API for running QBench evaluations."""
 
 import asyncio
-import json
+import functools
 import logging
+import os
+import time
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import List, NotRequired, Optional, Any, TypedDict, cast
+
+import orjson
+from pydantic import HttpUrl
 
 from qbench.agent.base import Agent
-from qbench.scenarios import get_scenario_names, get_scenario_count
+from qbench.scenarios import AVAILABLE_SCENARIOS, get_scenario_names
 from qbench.config import (
     DEFAULT_PURPLE_AGENT_URL,
     DEFAULT_SCENARIOS_DIR,
@@ -20,8 +27,96 @@ from qbench.config import (
     RESULTS_DIR,
 )
 
+# Faster event loop for parallel episodes; optional and not available on Windows
+try:
+    import uvloop  # type: ignore[import-not-found]
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 logger = logging.getLogger("qbench.api")
 
+class QBenchResultMetrics(TypedDict):
+    """Soft metrics section of a run_qbench result."""
+
+    routine_sla: float
+    avg_wait_time: float
+    avg_backlog: float
+    max_backlog: int
+    avg_utilization: float
+
+
+class QBenchResults(TypedDict):
+    """Dictionary returned by run_qbench."""
+
+    pass_rate: float
+    passed_episodes: int
+    failed_episodes: int
+    total_episodes: int
+    metrics: QBenchResultMetrics
+    summary: str
+    duration_seconds: float
+    output_file: NotRequired[str]
+    runtime_dir: NotRequired[str]
+    save_error: NotRequired[str]
+
+
+# Result schema: keys copied from the evaluator's final metrics, with defaults
+_RESULT_DEFAULTS: dict[str, Any] = {
+    "pass_rate": 0.0,
+    "passed_episodes": 0,
+    "failed_episodes": 0,
+    "total_episodes": 0,
+}
+_METRIC_DEFAULTS: dict[str, Any] = {
+    "routine_sla": 0.0,
+    "avg_wait_time": 0.0,
+    "avg_backlog": 0.0,
+    "max_backlog": 0,
+    "avg_utilization": 0.0,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _validate_url(url: str) -> HttpUrl:
+    """Validate a participant URL once per distinct value."""
+    return HttpUrl(url)
+
+
+def _write_unbuffered(path: Path, data: bytes) -> None:
+    """
+    Write bytes straight to a file descriptor, bypassing Python's I/O stack.
+
+    No fsync: results are written once and the rename provides atomicity.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+async def _run_eval(
+    evaluator: Any, req: Any, updater: Any, agent: "AgentAdapter", parallel: int
+) -> None:
+    """
+    Run the evaluation with enough worker threads for `parallel` episodes.
+
+    Episodes run on the loop, but agents without a native aact() still make
+    their act() calls in the loop's default executor, which otherwise caps
+    out at min(32, cpu_count + 4) threads and silently limits concurrency
+    below `parallel`. The loop is private to run_qbench, so resizing it is safe;
+    asyncio.run shuts the executor down on exit.
+    """
+    max_workers = max(parallel, min(32, (os.cpu_count() or 1) + 4))
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="qbench-episode")
+    )
+    await evaluator.run_eval(req, updater, agent_override=agent)
+
 
 class AgentAdapter:
     """Adapter to wrap Agent interface for use with existing evaluator."""
@@ -33,6 +128,10 @@ class AgentAdapter:
         """Forward to wrapped agent."""
         return self.agent.act(observation)
 
+    async def aact(self, observation: str) -> str:
+        """Forward to wrapped agent (async)."""
+        return await self.agent.aact(observation)
+
 
 def run_qbench(
     agent: Agent,
@@ -45,7 +144,7 @@ def run_qbench(
     max_episodes: Optional[int] = None,
     purple_agent_url: str = DEFAULT_PURPLE_AGENT_URL,
     scenarios_dir: str = DEFAULT_SCENARIOS_DIR
-) -> Dict[str, Any]:
+) -> QBenchResults:
     """
     Run QBench evaluation on an agent (standalone mode).
 
@@ -126,20 +225,24 @@ def run_qbench(
     try:
         from qbench.evaluator.qbench_evaluator import QBenchEvaluator, StandaloneUpdater
         from agentbeats.models import EvalRequest
-        from pydantic import HttpUrl
     except ImportError as e:
         raise ImportError(
             f"Required dependencies not available: {e}. "
             "Make sure QBench is properly installed."
         )
 
-    # Validate scenarios
-    scenario_names = get_scenario_names(scenarios)
-    num_scenarios = get_scenario_count(scenarios)
+    # Validate scenarios (the full catalog needs no validation and is only
+    # read here, so it is used without copying)
+    scenario_names = AVAILABLE_SCENARIOS if scenarios is None else get_scenario_names(scenarios)
+    num_scenarios = len(scenario_names)
     
-    logger.info(f"Running QBench evaluation with {num_scenarios} scenarios")
-    if verbose:
-        logger.info(f"Scenarios: {', '.join(scenario_names[:5])}{'...' if len(scenario_names) > 5 else ''}")
+    logger.info("Running QBench evaluation with %d scenarios", num_scenarios)
+    if verbose and logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Scenarios: %s%s",
+            ", ".join(scenario_names[:5]),
+            "..." if len(scenario_names) > 5 else "",
+        )
     
     # Create evaluator
     evaluator = QBenchEvaluator(
@@ -152,8 +255,10 @@ def run_qbench(
     wrapped_agent = AgentAdapter(agent)
     
     # Create eval request (mimics AgentBeats structure but runs standalone)
-    req = EvalRequest(
-        participants={"agent": HttpUrl(purple_agent_url)},
+    # Fields are already valid (cached HttpUrl, free-form config), so skip
+    # re-running model validation
+    req = EvalRequest.model_construct(
+        participants={"agent": _validate_url(purple_agent_url)},
         config={
             "scenario_types": scenario_names if scenarios else None,
             "seeds": seeds if seeds is not None else [1, 2, 3],
@@ -167,34 +272,28 @@ def run_qbench(
     
     # Run evaluation
     logger.info("Starting evaluation...")
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     try:
         # Run async evaluation
-        asyncio.run(evaluator.run_eval(req, updater, agent_override=wrapped_agent))
+        asyncio.run(
+            _run_eval(evaluator, req, updater, wrapped_agent, parallel),
+            debug=False,
+            loop_factory=uvloop.new_event_loop if UVLOOP_AVAILABLE else None,
+        )
     except Exception as e:
-        logger.error(f"Evaluation failed: {e}")
+        logger.error("Evaluation failed: %s", e)
         raise
     
-    duration = (datetime.now() - start_time).total_seconds()
-    logger.info(f"Evaluation completed in {duration:.1f}s")
+    duration = time.perf_counter() - start_time
+    logger.info("Evaluation completed in %.1fs", duration)
     
     # Extract results
-    results = {
-        "pass_rate": updater.final_metrics.get("pass_rate", 0.0) if updater.final_metrics else 0.0,
-        "passed_episodes": updater.final_metrics.get("passed_episodes", 0) if updater.final_metrics else 0,
-        "failed_episodes": updater.final_metrics.get("failed_episodes", 0) if updater.final_metrics else 0,
-        "total_episodes": updater.final_metrics.get("total_episodes", 0) if updater.final_metrics else 0,
-        "metrics": {
-            "routine_sla": updater.final_metrics.get("routine_sla", 0.0) if updater.final_metrics else 0.0,
-            "avg_wait_time": updater.final_metrics.get("avg_wait_time", 0.0) if updater.final_metrics else 0.0,
-            "avg_backlog": updater.final_metrics.get("avg_backlog", 0.0) if updater.final_metrics else 0.0,
-            "max_backlog": updater.final_metrics.get("max_backlog", 0) if updater.final_metrics else 0,
-            "avg_utilization": updater.final_metrics.get("avg_utilization", 0.0) if updater.final_metrics else 0.0,
-        },
-        "summary": updater.final_summary or "No summary available",
-        "duration_seconds": duration,
-    }
+    m = ChainMap(updater.final_metrics or {}, _RESULT_DEFAULTS, _METRIC_DEFAULTS)
+    results = cast(QBenchResults, {key: m[key] for key in _RESULT_DEFAULTS})
+    results["metrics"] = cast(QBenchResultMetrics, {key: m[key] for key in _METRIC_DEFAULTS})
+    results["summary"] = updater.final_summary or "No summary available"
+    results["duration_seconds"] = duration
     
     # Save results if requested
     if save_results:
@@ -211,7 +310,7 @@ def run_qbench(
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
             result_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(),  # orjson writes ISO 8601 natively
                 "config": {
                     "scenarios": scenario_names if scenarios else "all",
                     "seeds": seeds if seeds is not None else [1, 2, 3],
@@ -221,14 +320,16 @@ def run_qbench(
                 **results
             }
 
-            # Write results to file
-            with open(output_file, 'w') as f:
-                json.dump(result_data, f, indent=2)
+            # Write results to file: one write to a temp file, then an atomic
+            # rename so a crash never leaves a truncated results.json
+            tmp_file = output_file.with_suffix(output_file.suffix + ".tmp")
+            _write_unbuffered(tmp_file, orjson.dumps(result_data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, output_file)
 
             results["output_file"] = str(output_file)
             results["runtime_dir"] = str(updater.runtime_dir)
-            logger.info(f"Results saved to: {output_file}")
-            logger.info(f"Runtime directory: {updater.runtime_dir}")
+            logger.info("Results saved to: %s", output_file)
+            logger.info("Runtime directory: %s", updater.runtime_dir)
 
         except (OSError, IOError) as e:
             error_msg = f"Failed to save results to '{output_path if output_path else 'runtime directory'}': {e}"
@@ -1,11 +1,13 @@
 """Command-line interface for QBench."""
 
 import argparse
+import functools
+import importlib
 import logging
 import sys
 import warnings
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, cast
 
 from qbench.config import (
     DEFAULT_PURPLE_AGENT_URL,
@@ -14,6 +16,9 @@ from qbench.config import (
     DEFAULT_PARALLEL,
 )
 
+if TYPE_CHECKING:
+    from qbench.agent.base import Agent
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger("qbench.cli")
 
@@ -36,12 +41,16 @@ def import_agent_class(module_path: str):
         )
     
     module_name, class_name = parts
-    
+    return _import_agent_cached(module_name, class_name)
+
+
+@functools.cache
+def _import_agent_cached(module_name: str, class_name: str) -> "type[Agent]":
+    """Resolve module_name.class_name once; failures are not cached and can be retried."""
     try:
-        import importlib
         module = importlib.import_module(module_name)
         agent_class = getattr(module, class_name)
-        return agent_class
+        return cast("type[Agent]", agent_class)
     except ImportError as e:
         raise ImportError(
             f"Could not import module '{module_name}': {e}\n"
@@ -55,8 +64,6 @@ def import_agent_class(module_path: str):
 
 def cmd_eval(args):
     """Unified evaluation command - routes to standalone, remote, or orchestrated mode."""
-    from qbench.runner.utils import parse_scenarios, parse_seeds
-
     # Determine mode
     if args.agent:
         _cmd_eval_standalone(args)
@@ -79,11 +86,11 @@ def _cmd_eval_standalone(args):
     scenario_names = parse_scenarios(args.scenarios, scenarios_dir)
     seed_indices = parse_seeds(args.seeds)
 
-    logger.info(f"Standalone mode: {len(scenario_names)} scenarios, {len(seed_indices)} seeds each")
-    logger.info(f"Total episodes: {len(scenario_names) * len(seed_indices)}")
+    logger.info("Standalone mode: %d scenarios, %d seeds each", len(scenario_names), len(seed_indices))
+    logger.info("Total episodes: %d", len(scenario_names) * len(seed_indices))
 
     # Import agent class
-    logger.info(f"Loading agent: {args.agent}")
+    logger.info("Loading agent: %s", args.agent)
     AgentClass = import_agent_class(args.agent)
     agent = AgentClass()
 
@@ -106,7 +113,7 @@ def _cmd_eval_standalone(args):
         print(summary)
 
     if args.output:
-        logger.info(f"Results saved to: {results.get('output_file', args.output)}")
+        logger.info("Results saved to: %s", results.get("output_file", args.output))
 
 
 def _cmd_eval_a2a_remote(args):
@@ -119,8 +126,8 @@ def _cmd_eval_a2a_remote(args):
     scenario_names = parse_scenarios(args.scenarios, scenarios_dir)
     seed_indices = parse_seeds(args.seeds)
 
-    logger.info(f"A2A Remote mode: {len(scenario_names)} scenarios, {len(seed_indices)} seeds each")
-    logger.info(f"Purple agent: {args.agent_url}")
+    logger.info("A2A Remote mode: %d scenarios, %d seeds each", len(scenario_names), len(seed_indices))
+    logger.info("Purple agent: %s", args.agent_url)
 
     # Run evaluation
     try:
@@ -140,7 +147,7 @@ def _cmd_eval_a2a_remote(args):
         # Results already printed by run_a2a_remote_sync if not quiet
 
     except Exception as e:
-        logger.error(f"A2A evaluation failed: {e}")
+        logger.error("A2A evaluation failed: %s", e)
         if args.verbose:
             import traceback
             traceback.print_exc()
@@ -149,14 +156,12 @@ def _cmd_eval_a2a_remote(args):
 
 def _cmd_eval_a2a_orchestrated(args):
     """Run A2A orchestrated evaluation mode (TOML config)."""
-    import asyncio
     from agentbeats.run_scenario import main as run_scenario_main
 
-    logger.info(f"A2A Orchestrated mode: {args.config}")
+    logger.info("A2A Orchestrated mode: %s", args.config)
 
     # Delegate to run_scenario which handles TOML orchestration
     # Temporarily override sys.argv for the orchestrator
-    import sys
     old_argv = sys.argv
     try:
         sys.argv = ["qbench-run", args.config]
@@ -180,7 +185,7 @@ def cmd_run(args):
     from qbench.api import run_qbench
 
     # Import agent class
-    logger.info(f"Loading agent: {args.agent}")
+    logger.info("Loading agent: %s", args.agent)
     AgentClass = import_agent_class(args.agent)
     agent = AgentClass()
 
@@ -225,7 +230,6 @@ def cmd_agentbeats(args):
     )
     print("⚠️  WARNING: 'qbench agentbeats' is deprecated. Use 'qbench eval --agent-url' instead.\n")
 
-    import asyncio
     import uvicorn
     from qbench.evaluator.qbench_evaluator import QBenchEvaluator, qbench_evaluator_agent_card
     from a2a.server.apps import A2AStarletteApplication
@@ -234,7 +238,7 @@ def cmd_agentbeats(args):
     from agentbeats.green_executor import GreenExecutor
     
     logger.info("Starting QBench in AgentBeats mode")
-    logger.info(f"Purple agent URL: {args.purple_agent_url}")
+    logger.info("Purple agent URL: %s", args.purple_agent_url)
     
     # Create evaluator
     evaluator = QBenchEvaluator(
@@ -263,7 +267,7 @@ def cmd_agentbeats(args):
     app = a2a_app.build()
 
     # Run server
-    logger.info(f"Starting green agent server on port {args.port}")
+    logger.info("Starting green agent server on port %d", args.port)
     uvicorn.run(app, host="0.0.0.0", port=args.port)
 
 
@@ -278,8 +282,9 @@ def cmd_list_scenarios(args):
     print()
 
 
-def main():
-    """Main CLI entry point."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; parse_args() can reuse it for every call."""
     parser = argparse.ArgumentParser(
         description="QBench - Queue Management Agent Benchmark",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -517,7 +522,14 @@ Seed selection:
         help="List all available scenarios"
     )
     list_parser.set_defaults(func=cmd_list_scenarios)
-    
+
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    parser = _build_parser()
+
     # Parse and execute
     args = parser.parse_args()
     
@@ -528,7 +540,7 @@ Seed selection:
     try:
         args.func(args)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         if args.command == "run" and "--verbose" in sys.argv:
             import traceback
             traceback.print_exc()
@@ -1,11 +1,14 @@
 """A2A client for sending evaluation requests to green agent."""
 
 import asyncio
-import json
+import itertools
 import logging
-import uuid
+import os
+import time
 from typing import Dict, Any, Optional
 
+import orjson
+
 logger = logging.getLogger("qbench.client.a2a")
 
 
@@ -18,10 +21,89 @@ try:
         write=30.0,     # 30 seconds to write request
         pool=30.0       # 30 seconds to get connection from pool
     )
+    DEFAULT_LIMITS = httpx.Limits(
+        max_connections=20,
+        max_keepalive_connections=20,
+        keepalive_expiry=30.0
+    )
 except ImportError:
     # Will be caught later in send_eval_request
     DEFAULT_TIMEOUT = 120.0
 
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Timeout for quick agent-card probes on the shared client
+AGENT_INFO_TIMEOUT = 5.0
+
+# Message/request IDs: a per-process prefix plus a counter is unique without
+# drawing from the OS CSPRNG on every call
+_id_prefix = f"{os.getpid():x}-{time.time_ns():x}-"
+_id_seq = itertools.count()
+
+
+def _next_id() -> str:
+    """Return a process-unique ID for an A2A message or JSON-RPC request."""
+    return _id_prefix + format(next(_id_seq), "x")
+
+
+# Agent cards by green agent URL as (fetched_at, card); saves a round-trip per eval
+AGENT_CARD_TTL = 300.0
+_card_cache: dict[str, tuple[float, Any]] = {}
+
+# Shared pooled client, created lazily and bound to the event loop that created it
+_client: "httpx.AsyncClient | None" = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_client() -> "httpx.AsyncClient":
+    """
+    Return the shared client for the running event loop.
+
+    A client left over from an earlier loop (e.g. a previous asyncio.run)
+    cannot be used from this one, so it is closed on its own loop and replaced.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None:
+            _close_on_own_loop(_client, _client_loop)
+        _client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT, limits=DEFAULT_LIMITS, http2=HTTP2_AVAILABLE
+        )
+        _client_loop = loop
+    return _client
+
+
+def _close_on_own_loop(
+    client: "httpx.AsyncClient", client_loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """Schedule aclose() for a client on the loop its connections belong to."""
+    if client.is_closed or client_loop is None:
+        return
+    if client_loop.is_closed():
+        # Its transports can no longer be closed; only aclose_client() avoids this
+        logger.debug("Shared A2A client outlived its event loop; call aclose_client() first")
+        return
+    # Runs now if that loop is running in another thread, else when it next runs
+    asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+
+
+async def aclose_client() -> None:
+    """Close the shared client; call before the event loop shuts down."""
+    global _client, _client_loop
+    if _client is not None:
+        if _client_loop is asyncio.get_running_loop():
+            await _client.aclose()
+        else:
+            _close_on_own_loop(_client, _client_loop)
+    _client = None
+    _client_loop = None
+
 
 async def send_eval_request(
     green_agent_url: str,
@@ -90,63 +172,74 @@ async def send_eval_request(
         }
     }
 
-    # Get agent card
-    async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as httpx_client:
-        try:
+    # Get agent card (shared pooled client, reused across calls)
+    httpx_client = _get_client()
+    try:
+        cached = _card_cache.get(green_agent_url)
+        if cached and time.monotonic() - cached[0] < AGENT_CARD_TTL:
+            agent_card = cached[1]
+        else:
             resolver = A2ACardResolver(httpx_client=httpx_client, base_url=green_agent_url)
             agent_card = await resolver.get_agent_card()
 
             if agent_card is None:
                 raise Exception(f"Could not get agent card from {green_agent_url}")
 
+            _card_cache[green_agent_url] = (time.monotonic(), agent_card)
             logger.info(f"Connected to green agent: {agent_card.name if hasattr(agent_card, 'name') else 'Unknown'}")
 
-            # Create A2A client
-            client = A2AClient(httpx_client=httpx_client, agent_card=agent_card)
+        # Create A2A client
+        client = A2AClient(httpx_client=httpx_client, agent_card=agent_card)
 
-            # Create message
-            message_id = uuid.uuid4().hex
-            request_id = uuid.uuid4().hex
+        # Create message
+        message_id = _next_id()
+        request_id = _next_id()
 
-            message = Message(
-                role=Role.user,
-                parts=[Part(root=TextPart(text=json.dumps(eval_request)))],
-                message_id=message_id,
-            )
+        message = Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text=orjson.dumps(eval_request).decode()))],
+            message_id=message_id,
+        )
 
-            params = MessageSendParams(message=message)
-            request = SendMessageRequest(id=request_id, params=params)
+        params = MessageSendParams(message=message)
+        request = SendMessageRequest(id=request_id, params=params)
 
-            # Send request
-            logger.info("Sending evaluation request...")
-            if verbose:
-                logger.info(f"Request: {json.dumps(eval_request, indent=2)}")
+        # Send request
+        logger.info("Sending evaluation request...")
+        if verbose:
+            logger.info(
+                "Request: %s",
+                orjson.dumps(eval_request, option=orjson.OPT_INDENT_2).decode()
+            )
 
-            response = await client.send_message(request=request)
+        response = await client.send_message(request=request)
 
-            # Parse response
-            if not response or not response.root:
-                raise Exception("Empty response from green agent")
+        # Parse response
+        if not response or not response.root:
+            raise Exception("Empty response from green agent")
 
-            if isinstance(response.root, JSONRPCErrorResponse):
-                raise Exception(f"Error response from green agent: {response.root}")
+        if isinstance(response.root, JSONRPCErrorResponse):
+            raise Exception(f"Error response from green agent: {response.root}")
 
-            if not isinstance(response.root, SendMessageSuccessResponse):
-                raise Exception(f"Unexpected response type from green agent: {type(response.root)}")
+        if not isinstance(response.root, SendMessageSuccessResponse):
+            raise Exception(f"Unexpected response type from green agent: {type(response.root)}")
 
-            logger.info("Evaluation complete, processing results...")
+        logger.info("Evaluation complete, processing results...")
 
-            # Extract results from response
-            # The green agent should return results as artifacts
-            # Pass the unwrapped success response (response.root)
-            results = await _extract_results_from_response(response.root)
+        # Extract results from response
+        # The green agent should return results as artifacts
+        # Pass the unwrapped success response (response.root)
+        results = await _extract_results_from_response(response.root)
 
-            return results
+        return results
 
-        except httpx.HTTPError as e:
-            raise Exception(f"HTTP error communicating with green agent: {e}") from e
-        except Exception as e:
-            raise Exception(f"Failed to communicate with green agent: {e}") from e
+    except httpx.HTTPError as e:
+        # The agent may have restarted with a different card; refetch next time
+        _card_cache.pop(green_agent_url, None)
+        raise Exception(f"HTTP error communicating with green agent: {e}") from e
+    except Exception as e:
+        _card_cache.pop(green_agent_url, None)
+        raise Exception(f"Failed to communicate with green agent: {e}") from e
 
 
 async def _extract_results_from_response(response) -> Dict[str, Any]:
@@ -162,30 +255,41 @@ async def _extract_results_from_response(response) -> Dict[str, Any]:
         Results dictionary
     """
     try:
-        # Check if response has artifacts
-        if hasattr(response.result, 'artifacts') and response.result.artifacts:
-            for artifact in response.result.artifacts:
-                if hasattr(artifact, 'parts') and artifact.parts:
-                    for part in artifact.parts:
-                        # Look for DataPart with results
-                        if hasattr(part, 'root') and hasattr(part.root, 'data'):
-                            return part.root.data
-                        # Also try TextPart with JSON
-                        elif hasattr(part, 'root') and hasattr(part.root, 'text'):
-                            try:
-                                return json.loads(part.root.text)
-                            except json.JSONDecodeError:
-                                pass
-
-        # Fallback: try to parse from message parts
-        if hasattr(response.result, 'message') and hasattr(response.result.message, 'parts'):
-            for part in response.result.message.parts:
-                if hasattr(part, 'root') and hasattr(part.root, 'text'):
+        result = response.result
+
+        # Check if response has artifacts. A DataPart anywhere wins: the green
+        # agent sends a human-readable TextPart summary ahead of the DataPart,
+        # and decoding that text first is wasted work on every response.
+        artifacts = getattr(result, 'artifacts', None)
+        if artifacts:
+            roots = [
+                getattr(part, 'root', None)
+                for artifact in artifacts
+                for part in getattr(artifact, 'parts', None) or ()
+            ]
+            for root in roots:
+                data = getattr(root, 'data', None)
+                if data is not None:
+                    return data
+            # Also try TextPart with JSON
+            for root in roots:
+                text = getattr(root, 'text', None)
+                if text is not None:
                     try:
-                        return json.loads(part.root.text)
-                    except json.JSONDecodeError:
+                        return orjson.loads(text)
+                    except ValueError:  # includes orjson.JSONDecodeError
                         pass
 
+        # Fallback: try to parse from message parts
+        message = getattr(result, 'message', None)
+        for part in getattr(message, 'parts', None) or ():
+            text = getattr(getattr(part, 'root', None), 'text', None)
+            if text is not None:
+                try:
+                    return orjson.loads(text)
+                except ValueError:  # includes orjson.JSONDecodeError
+                    pass
+
         # If we get here, couldn't extract results
         logger.warning("Could not extract results from response, returning raw response")
         return {
@@ -212,24 +316,23 @@ async def get_agent_info(agent_url: str) -> Optional[Dict[str, Any]]:
         Agent card as dictionary, or None if failed
     """
     try:
-        import httpx
+        import httpx  # noqa: F401
         from a2a.client import A2ACardResolver
     except ImportError:
         logger.error("a2a-sdk not installed")
         return None
 
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resolver = A2ACardResolver(httpx_client=client, base_url=agent_url)
-            card = await resolver.get_agent_card()
-
-            if card:
-                return {
-                    "name": getattr(card, 'name', 'Unknown'),
-                    "description": getattr(card, 'description', ''),
-                    "version": getattr(card, 'version', ''),
-                    "url": getattr(card, 'url', agent_url),
-                }
+        resolver = A2ACardResolver(httpx_client=_get_client(), base_url=agent_url)
+        card = await resolver.get_agent_card(http_kwargs={"timeout": AGENT_INFO_TIMEOUT})
+
+        if card:
+            return {
+                "name": getattr(card, 'name', 'Unknown'),
+                "description": getattr(card, 'description', ''),
+                "version": getattr(card, 'version', ''),
+                "url": getattr(card, 'url', agent_url),
+            }
     except Exception as e:
         logger.error(f"Failed to get agent info from {agent_url}: {e}")
 
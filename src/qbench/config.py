@@ -4,15 +4,19 @@ This module contains all configuration defaults and constants used throughout QB
 Users can override these values by passing parameters to the API functions.
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the absolute path to the QBench project root directory.
 
     The project root is identified by the presence of pyproject.toml.
     This ensures results are saved to a consistent location regardless of
-    where QBench commands are run from.
+    where QBench commands are run from. The result is cached for the
+    lifetime of the process.
 
     Returns:
         Path: Absolute path to project root directory
@@ -24,8 +28,8 @@ def get_project_root() -> Path:
     current = Path(__file__).resolve().parent
 
     # Walk up the directory tree looking for pyproject.toml
-    for parent in [current] + list(current.parents):
-        if (parent / "pyproject.toml").exists():
+    for parent in (current, *current.parents):
+        if os.path.exists(os.path.join(parent, "pyproject.toml")):
             return parent
 
     # Fallback: if not found, use the parent of the src directory
@@ -11,6 +11,10 @@ class Action(BaseModel):
 
     Actions allow the agent to control the queue system by scheduling,
     rescheduling, rejecting, or cancelling tasks.
+
+    Use Action(...) for untrusted input (e.g. JSON from an agent) so it is
+    validated. Code that already holds well-typed values may use
+    Action.model_construct(...) to skip validation.
     """
 
     type: Literal["schedule", "reschedule", "reject", "cancel", "noop"] = Field(
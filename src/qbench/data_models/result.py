@@ -4,6 +4,13 @@ from pydantic import BaseModel, Field
 
 from qbench.data_models.violation import Violation
 
+# Display templates for the __str__ methods below
+_METRICS_FMT = (
+    "Metrics(routine_sla={:.3f}, wait={:.1f}, backlog={:.1f}/{}, util={:.3f})"
+)
+_EPISODE_FMT = "{}{} - {}"
+_BENCHMARK_FMT = "BenchmarkResult({}/{} passed, {:.1%} pass rate)"
+
 
 class Metrics(BaseModel):
     """
@@ -20,11 +27,12 @@ class Metrics(BaseModel):
 
     def __str__(self) -> str:
         """Human-readable string representation."""
-        return (
-            f"Metrics(routine_sla={self.routine_sla:.3f}, "
-            f"wait={self.avg_wait_time:.1f}, "
-            f"backlog={self.avg_backlog:.1f}/{self.max_backlog}, "
-            f"util={self.avg_utilization:.3f})"
+        return _METRICS_FMT.format(
+            self.routine_sla,
+            self.avg_wait_time,
+            self.avg_backlog,
+            self.max_backlog,
+            self.avg_utilization,
         )
 
 
@@ -53,7 +61,7 @@ class EpisodeResult(BaseModel):
         """Human-readable string representation."""
         status = "PASS ✓" if self.passed else "FAIL ✗"
         violations_str = f" ({len(self.violations)} violations)" if not self.passed else ""
-        return f"{status}{violations_str} - {self.metrics}"
+        return _EPISODE_FMT.format(status, violations_str, self.metrics)
 
 
 class BenchmarkResult(BaseModel):
@@ -78,7 +86,4 @@ class BenchmarkResult(BaseModel):
 
     def __str__(self) -> str:
         """Human-readable string representation."""
-        return (
-            f"BenchmarkResult({self.passed}/{self.total_episodes} passed, "
-            f"{self.pass_rate:.1%} pass rate)"
-        )
+        return _BENCHMARK_FMT.format(self.passed, self.total_episodes, self.pass_rate)
@@ -5,6 +5,9 @@ from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+# Lifecycle states a task moves through
+TaskStatus = Literal["pending", "scheduled", "completed", "rejected", "cancelled", "missed"]
+
 
 class Task(BaseModel):
     """
@@ -19,7 +22,7 @@ class Task(BaseModel):
     arrival_time: int = Field(ge=0, description="Time step when task arrives")
     priority: Literal["urgent", "routine"] = Field(description="Task priority level")
     deadline: int = Field(ge=0, description="Latest step by which task must complete")
-    status: Literal["pending", "scheduled", "completed", "rejected", "cancelled", "missed"] = Field(
+    status: TaskStatus = Field(
         default="pending", description="Current status of the task"
     )
     scheduled_slot: int | None = Field(
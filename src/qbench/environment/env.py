@@ -1,11 +1,12 @@
 """QueueEnv - Core environment for QBench."""
 
-from copy import deepcopy
+import heapq
+from collections.abc import Callable
 
 from qbench.data_models.action import Action
-from qbench.environment.loader import SeedConfig
+from qbench.environment.loader import SeedConfig, TaskEvent
 from qbench.data_models.observation import Observation, ScheduledTask
-from qbench.data_models.task import Task
+from qbench.data_models.task import Task, TaskStatus
 
 
 class QueueEnv:
@@ -27,7 +28,8 @@ class QueueEnv:
         self.horizon = config.horizon
         self.initial_capacity = config.capacity_per_step
         self.capacity_per_step = config.capacity_per_step
-        self.event_schedule = config.events
+        # Seed JSON keys events by step string; re-key once so steps index by int
+        self.event_schedule = {int(step): events for step, events in config.events.items()}
 
         # State variables
         self.time = 0
@@ -41,8 +43,46 @@ class QueueEnv:
         self.cancelled: set[str] = set()
         self.missed: set[str] = set()
 
-        # Schedule: step -> list of task IDs
-        self.schedule: dict[int, list[str]] = {}
+        # Schedule: step -> task IDs (insertion-ordered dict for O(1) removal)
+        self.schedule: dict[int, dict[str, None]] = {}
+
+        # Min-heap of (deadline, arrival seq, uid) over tasks whose deadline
+        # has not yet passed; resolved tasks are skipped lazily when popped
+        self._deadline_heap: list[tuple[int, int, str]] = []
+
+        # Original task ID -> UIDs in arrival order (IDs may repeat across arrivals)
+        self.id_index: dict[str, list[str]] = {}
+
+        # Task snapshots handed out by the last observe(), by UID. A task's
+        # fields only change along with its status or slot, so an unchanged
+        # task's snapshot is reused by the next observation instead of copied.
+        self._snapshots: dict[str, Task] = {}
+        self._scheduled_snapshots: dict[str, ScheduledTask] = {}
+
+        # Pending/scheduled lists from the last observe(); reset to None
+        # wherever the pending or scheduled state changes
+        self._pending_view: list[Task] | None = None
+        self._scheduled_view: list[ScheduledTask] | None = None
+
+        # State epoch, bumped by reset(), act(), _apply_action() and
+        # _transition(), and the observation built at _last_obs_epoch;
+        # observe() reuses it until the epoch moves on
+        self._epoch = 0
+        self._last_obs: Observation | None = None
+        self._last_obs_epoch = -1
+
+        # Dispatch tables for seed events and agent actions, keyed by type
+        self._event_handlers: dict[str, Callable[[TaskEvent], None]] = {
+            "arrival": self._handle_arrival,
+            "cancel": self._handle_external_cancel,
+            "capacity_change": self._handle_capacity_change,
+        }
+        self._action_handlers: dict[str, Callable[[Action, Task, str], None]] = {
+            "schedule": self._apply_schedule,
+            "reschedule": self._apply_reschedule,
+            "reject": self._apply_reject,
+            "cancel": self._apply_cancel,
+        }
 
         # Track events for current step (for observation)
         self.current_arrivals: list[Task] = []
@@ -63,12 +103,9 @@ class QueueEnv:
         Returns:
             (task, uid) if found, (None, None) otherwise
         """
-        search_space = status_set if status_set is not None else self.tasks.keys()
-
-        for uid in search_space:
-            task = self.tasks.get(uid)
-            if task and task.id == task_id:
-                return task, uid
+        for uid in self.id_index.get(task_id, ()):
+            if status_set is None or uid in status_set:
+                return self.tasks[uid], uid
 
         return None, None
 
@@ -94,6 +131,7 @@ class QueueEnv:
             Initial observation for the Purple agent
         """
         # Reset time and state
+        self._epoch += 1
         self.time = 0
         self.capacity_per_step = self.initial_capacity
         self.tasks.clear()
@@ -107,10 +145,17 @@ class QueueEnv:
 
         self.schedule.clear()
 
-        self.current_arrivals.clear()
-        self.current_cancellations.clear()
-        self.current_completions.clear()
-        self.current_misses.clear()
+        self._deadline_heap.clear()
+        self.id_index.clear()
+        self._snapshots.clear()
+        self._scheduled_snapshots.clear()
+        self._pending_view = None
+        self._scheduled_view = None
+
+        self.current_arrivals = []
+        self.current_cancellations = []
+        self.current_completions = []
+        self.current_misses = []
 
         # Inject events for step 0
         self._inject_events(0)
@@ -137,14 +182,18 @@ class QueueEnv:
             Tuple of (next_observation, done)
             - done is True when time reaches horizon
         """
-        # Clear current step tracking
-        self.current_completions.clear()
-        self.current_misses.clear()
+        self._epoch += 1
+
+        # Start fresh step tracking; the previous lists now belong to the
+        # observations they were handed to
+        self.current_completions = []
+        self.current_misses = []
 
         # Apply each action
+        apply_action = self._apply_action
         for action in actions:
             if action.type != "noop":
-                self._apply_action(action)
+                apply_action(action)
 
         # Process completions for tasks scheduled at current time
         self._process_completions()
@@ -176,51 +225,69 @@ class QueueEnv:
         Args:
             step: The time step to inject events for
         """
-        self.current_arrivals.clear()
-        self.current_cancellations.clear()
-
-        # Get events for this step (events dict uses string keys)
-        events = self.event_schedule.get(str(step), [])
-
-        for event in events:
-            if event.type == "arrival" and event.task:
-                # Create new task
-                task_data = event.task
-                task = Task(
-                    id=task_data["id"],
-                    arrival_time=task_data["arrival_time"],
-                    priority=task_data["priority"],
-                    deadline=task_data["deadline"],
-                    status="pending",
-                )
-                self.tasks[task.uid] = task
-                self.pending.add(task.uid)
-                self.current_arrivals.append(task)
-
-            elif event.type == "cancel" and event.task_id:
-                # External cancellation (not agent-initiated)
-                task_id = event.task_id
-                task, uid = self.find_task_by_id(task_id)
-                if task and uid:
-                    # Remove from current status set
-                    if uid in self.pending:
-                        self.pending.remove(uid)
-                    elif uid in self.scheduled:
-                        self.scheduled.remove(uid)
-                        # Remove from schedule
-                        if task.scheduled_slot is not None:
-                            slot = task.scheduled_slot
-                            if slot in self.schedule and uid in self.schedule[slot]:
-                                self.schedule[slot].remove(uid)
-
-                    # Mark as cancelled
-                    task.status = "cancelled"
-                    self.cancelled.add(uid)
-                    self.current_cancellations.append(task_id)
-
-            elif event.type == "capacity_change" and event.new_capacity is not None:
-                # Tier-2 feature: dynamic capacity changes
-                self.capacity_per_step = event.new_capacity
+        self.current_arrivals = []
+        self.current_cancellations = []
+
+        # Get events for this step and dispatch each by type
+        handlers = self._event_handlers
+        for event in self.event_schedule.get(step, ()):
+            handler = handlers.get(event.type)
+            if handler is not None:
+                handler(event)
+
+    def _handle_arrival(self, event: TaskEvent) -> None:
+        """Create a pending task for an arrival event."""
+        task_data = event.task
+        if not task_data:
+            return
+
+        task = Task(
+            id=task_data["id"],
+            arrival_time=task_data["arrival_time"],
+            priority=task_data["priority"],
+            deadline=task_data["deadline"],
+            status="pending",
+        )
+        uid = task.uid
+        tasks = self.tasks
+        tasks[uid] = task
+        self.id_index.setdefault(task.id, []).append(uid)
+        self.pending.add(uid)
+        self._pending_view = None
+        heapq.heappush(self._deadline_heap, (task.deadline, len(tasks), uid))
+        self.current_arrivals.append(task)
+
+    def _handle_external_cancel(self, event: TaskEvent) -> None:
+        """Cancel a task on behalf of the scenario (not agent-initiated)."""
+        task_id = event.task_id
+        if not task_id:
+            return
+
+        task, uid = self.find_task_by_id(task_id)
+        if not task or not uid:
+            return
+
+        # Leave the current status set (if still live) and mark as cancelled
+        from_set = None
+        if uid in self.pending:
+            from_set = self.pending
+        elif uid in self.scheduled:
+            from_set = self.scheduled
+            # Remove from schedule
+            slot = task.scheduled_slot
+            bucket = self.schedule.get(slot) if slot is not None else None
+            if bucket is not None:
+                bucket.pop(uid, None)
+
+        self._transition(
+            uid, task, from_set, self.cancelled, "cancelled",
+            self.current_cancellations, task_id
+        )
+
+    def _handle_capacity_change(self, event: TaskEvent) -> None:
+        """Apply a dynamic capacity change (Tier-2 feature)."""
+        if event.new_capacity is not None:
+            self.capacity_per_step = event.new_capacity
 
     def _apply_action(self, action: Action) -> None:
         """
@@ -235,64 +302,71 @@ class QueueEnv:
         if action.task_id is None:
             return
 
-        task_id = action.task_id
+        handler = self._action_handlers.get(action.type)
+        if handler is None:
+            return
 
         # Find task by original ID (FIFO if duplicates)
-        task, uid = self.find_task_by_id(task_id)
+        task, uid = self.find_task_by_id(action.task_id)
 
         # Skip if task doesn't exist
         if not task or not uid:
             return
 
-        if action.type == "schedule":
-            if task.status == "pending" and action.step is not None:
-                # Schedule the task
-                task.status = "scheduled"
-                task.scheduled_slot = action.step
-
-                # Update state sets
-                self.pending.discard(uid)
-                self.scheduled.add(uid)
-
-                # Add to schedule
-                if action.step not in self.schedule:
-                    self.schedule[action.step] = []
-                self.schedule[action.step].append(uid)
-
-        elif action.type == "reschedule":
-            if task.status == "scheduled" and action.step is not None:
-                # Remove from old slot
-                old_slot = task.scheduled_slot
-                if old_slot is not None and old_slot in self.schedule:
-                    if uid in self.schedule[old_slot]:
-                        self.schedule[old_slot].remove(uid)
-
-                # Add to new slot
-                task.scheduled_slot = action.step
-                if action.step not in self.schedule:
-                    self.schedule[action.step] = []
-                self.schedule[action.step].append(uid)
-
-        elif action.type == "reject":
-            if task.status == "pending":
-                # Reject the task (only valid for routine tasks)
-                task.status = "rejected"
-                self.pending.discard(uid)
-                self.rejected.add(uid)
-
-        elif action.type == "cancel":
-            # Agent-initiated cancellation
-            if task.status == "scheduled":
-                # Remove from schedule
-                if task.scheduled_slot is not None:
-                    slot = task.scheduled_slot
-                    if slot in self.schedule and uid in self.schedule[slot]:
-                        self.schedule[slot].remove(uid)
-
-                # Mark as cancelled
-                task.status = "cancelled"
-                self.scheduled.discard(uid)
-                self.cancelled.add(uid)
+        # Callers such as EpisodeRunner apply actions directly, outside act()
+        self._epoch += 1
+        handler(action, task, uid)
+
+    def _apply_schedule(self, action: Action, task: Task, uid: str) -> None:
+        """Move a pending task into the requested slot."""
+        if task.status != "pending" or action.step is None:
+            return
+
+        # Schedule the task
+        task.scheduled_slot = action.step
+        self._transition(uid, task, self.pending, self.scheduled, "scheduled")
+
+        # Add to schedule
+        self.schedule.setdefault(action.step, {})[uid] = None
+
+    def _apply_reschedule(self, action: Action, task: Task, uid: str) -> None:
+        """Move a scheduled task to a different slot."""
+        if task.status != "scheduled" or action.step is None:
+            return
+
+        schedule = self.schedule
+
+        # Remove from old slot
+        slot = task.scheduled_slot
+        bucket = schedule.get(slot) if slot is not None else None
+        if bucket is not None:
+            bucket.pop(uid, None)
+
+        # Add to new slot
+        task.scheduled_slot = action.step
+        self._scheduled_view = None
+        schedule.setdefault(action.step, {})[uid] = None
+
+    def _apply_reject(self, action: Action, task: Task, uid: str) -> None:
+        """Reject a pending task (only valid for routine tasks)."""
+        if task.status != "pending":
+            return
+
+        self._transition(uid, task, self.pending, self.rejected, "rejected")
+
+    def _apply_cancel(self, action: Action, task: Task, uid: str) -> None:
+        """Cancel a scheduled task (agent-initiated)."""
+        if task.status != "scheduled":
+            return
+
+        # Remove from schedule
+        slot = task.scheduled_slot
+        bucket = self.schedule.get(slot) if slot is not None else None
+        if bucket is not None:
+            bucket.pop(uid, None)
+
+        # Mark as cancelled
+        self._transition(uid, task, self.scheduled, self.cancelled, "cancelled")
 
     def _process_completions(self) -> None:
         """
@@ -300,79 +374,190 @@ class QueueEnv:
 
         Tasks scheduled for the current step are marked as completed.
         """
-        if self.time not in self.schedule:
-            return
-
-        for uid in self.schedule[self.time][:]:  # Copy list to avoid modification issues
-            if uid in self.tasks:
-                task = self.tasks[uid]
-                if task.status == "scheduled":
-                    task.status = "completed"
-                    task.completed_time = self.time
-
-                    self.scheduled.discard(uid)
-                    self.completed.add(uid)
-                    self.current_completions.append(task.id)
+        now = self.time
+        tasks = self.tasks
+        scheduled = self.scheduled
+        completed = self.completed
+        completions = self.current_completions
+        transition = self._transition
+
+        # Completing a task leaves its schedule entry in place (the final
+        # schedule feeds utilization metrics), so no snapshot is needed
+        for uid in self.schedule.get(now, ()):
+            task = tasks.get(uid)
+            if task is None or task.status != "scheduled":
+                continue
+
+            task.completed_time = now
+            transition(uid, task, scheduled, completed, "completed", completions, task.id)
 
     def _mark_deadline_misses(self) -> None:
         """
         Mark tasks that have passed their deadline without completion.
 
-        Checks all pending and scheduled tasks to see if current time
-        exceeds their deadline.
+        Pops expired entries off the deadline heap and marks those still
+        pending or scheduled as missed; entries for tasks that were already
+        completed, rejected or cancelled are simply discarded. Cost is
+        proportional to the tasks expiring this step, not the queue size.
         """
+        now = self.time
+        heap = self._deadline_heap
+        expired_uids = []
+        while heap and heap[0][0] < now:
+            expired_uids.append(heapq.heappop(heap)[2])
+        if not expired_uids:
+            return
+
+        tasks = self.tasks
+        pending = self.pending
+        scheduled = self.scheduled
+        schedule = self.schedule
+
+        # Misses are applied in bulk (one set update each) rather than through
+        # _transition, since several tasks often expire in the same step
+
         # Check pending tasks
-        for uid in list(self.pending):  # Copy to avoid modification during iteration
-            task = self.tasks[uid]
-            if self.time > task.deadline:
-                task.status = "missed"
-                self.pending.remove(uid)
-                self.missed.add(uid)
-                self.current_misses.append(task.id)
+        missed_pending = [uid for uid in expired_uids if uid in pending]
+        if missed_pending:
+            pending.difference_update(missed_pending)
+            self._pending_view = None
 
         # Check scheduled tasks
-        for uid in list(self.scheduled):
-            task = self.tasks[uid]
-            if self.time > task.deadline:
-                # Remove from schedule
-                if task.scheduled_slot is not None:
-                    slot = task.scheduled_slot
-                    if slot in self.schedule and uid in self.schedule[slot]:
-                        self.schedule[slot].remove(uid)
-
-                task.status = "missed"
-                self.scheduled.remove(uid)
-                self.missed.add(uid)
-                self.current_misses.append(task.id)
+        missed_scheduled = [uid for uid in expired_uids if uid in scheduled]
+        if missed_scheduled:
+            scheduled.difference_update(missed_scheduled)
+            self._scheduled_view = None
+        for uid in missed_scheduled:
+            # Remove from schedule
+            slot = tasks[uid].scheduled_slot
+            bucket = schedule.get(slot) if slot is not None else None
+            if bucket is not None:
+                bucket.pop(uid, None)
+
+        misses = self.current_misses
+        for uid in missed_pending + missed_scheduled:
+            task = tasks[uid]
+            task.status = "missed"
+            misses.append(task.id)
+        self.missed.update(missed_pending)
+        self.missed.update(missed_scheduled)
 
     def observe(self) -> Observation:
         """
         Build the current observation snapshot for the Purple agent.
 
+        Repeated calls with no state change in between return the same
+        Observation object, so callers must not mutate it.
+
         Returns:
             Observation containing current state and events
         """
-        # Get all pending tasks
-        pending_tasks = [self.tasks[uid] for uid in self.pending]
-
-        # Get all scheduled tasks
-        scheduled_tasks = [
-            ScheduledTask(task=self.tasks[uid], slot=self.tasks[uid].scheduled_slot or 0)
-            for uid in self.scheduled
-            if self.tasks[uid].scheduled_slot is not None
+        if self._last_obs_epoch == self._epoch and self._last_obs is not None:
+            return self._last_obs
+
+        # Snapshot tasks so later env mutations don't leak into this observation.
+        # Task fields are all immutable scalars, so a shallow model_copy() is a
+        # full copy; snapshots of tasks unchanged since the last step are reused.
+        tasks = self.tasks
+
+        # Rebuild the pending/scheduled lists only after they have changed
+        pending_tasks = self._pending_view
+        if pending_tasks is None:
+            prev = self._snapshots
+            snapshots: dict[str, Task] = {}
+            for uid in self.pending:
+                snapshots[uid] = self._snapshot(tasks[uid], prev.get(uid))
+            self._snapshots = snapshots
+            pending_tasks = self._pending_view = list(snapshots.values())
+
+        scheduled_tasks = self._scheduled_view
+        if scheduled_tasks is None:
+            prev_scheduled = self._scheduled_snapshots
+            scheduled_snapshots: dict[str, ScheduledTask] = {}
+            for uid in self.scheduled:
+                task = tasks[uid]
+                if task.scheduled_slot is None:
+                    continue
+                entry = prev_scheduled.get(uid)
+                if entry is None or entry.slot != task.scheduled_slot:
+                    entry = ScheduledTask.model_construct(
+                        task=self._snapshot(task, None), slot=task.scheduled_slot
+                    )
+                scheduled_snapshots[uid] = entry
+            self._scheduled_snapshots = scheduled_snapshots
+            scheduled_tasks = self._scheduled_view = list(scheduled_snapshots.values())
+
+        snapshots = self._snapshots
+        arrivals = [
+            snapshots.get(task.uid) or task.model_copy()
+            for task in self.current_arrivals
         ]
 
-        return Observation(
+        # All fields are built here from env state, so validation is skipped.
+        # The per-step event lists are handed over without copying: the env
+        # replaces them with new lists at the next step instead of clearing
+        # them. The cached views are copied since the env keeps reusing them.
+        obs = Observation.model_construct(
             time=self.time,
             horizon=self.horizon,
             capacity_per_step=self.capacity_per_step,
-            arrivals=deepcopy(self.current_arrivals),
-            cancellations=self.current_cancellations.copy(),
-            pending=deepcopy(pending_tasks),
-            scheduled=deepcopy(scheduled_tasks),
-            completed_this_step=self.current_completions.copy(),
-            missed_this_step=self.current_misses.copy(),
+            arrivals=arrivals,
+            cancellations=self.current_cancellations,
+            pending=list(pending_tasks),
+            scheduled=list(scheduled_tasks),
+            completed_this_step=self.current_completions,
+            missed_this_step=self.current_misses,
         )
+        self._last_obs = obs
+        self._last_obs_epoch = self._epoch
+        return obs
+
+    def _transition(
+        self,
+        uid: str,
+        task: Task,
+        from_set: set[str] | None,
+        to_set: set[str],
+        new_status: TaskStatus,
+        event_list: list[str] | None = None,
+        event_id: str | None = None,
+    ) -> None:
+        """
+        Move a task between status sets and record the change.
+
+        Args:
+            uid: Internal task UID
+            task: The task being moved
+            from_set: Status set the task leaves (None if it is in none)
+            to_set: Status set the task joins
+            new_status: Status to assign to the task
+            event_list: Optional current_* list to record the change in
+            event_id: Original task ID to append to event_list
+        """
+        self._epoch += 1
+        task.status = new_status
+        if from_set is not None:
+            from_set.discard(uid)
+            if from_set is self.pending:
+                self._pending_view = None
+            elif from_set is self.scheduled:
+                self._scheduled_view = None
+        to_set.add(uid)
+        if to_set is self.scheduled:
+            self._scheduled_view = None
+        if event_list is not None and event_id is not None:
+            event_list.append(event_id)
+
+    @staticmethod
+    def _snapshot(task: Task, previous: Task | None) -> Task:
+        """Return previous if it still matches task, else a fresh copy of task."""
+        if (
+            previous is not None
+            and previous.status == task.status
+            and previous.scheduled_slot == task.scheduled_slot
+        ):
+            return previous
+        return task.model_copy()
 
     def get_state_summary(self) -> dict[str, int]:
         """
@@ -1,6 +1,7 @@
 """Scenario loader for QBench seed files."""
 
 import json
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -140,12 +141,15 @@ class ScenarioLoader:
                             f"Task {task_id} has negative arrival_time: {arrival_time}"
                         )
 
-    def list_scenarios(self, scenario_type: str | None = None) -> list[Path]:
+    def list_scenarios(
+        self, scenario_type: str | None = None, seeds: Iterable[int] | None = None
+    ) -> list[Path]:
         """
         List all seed files in the scenarios directory.
 
         Args:
             scenario_type: Optional scenario type subdirectory to filter by
+            seeds: Optional seed numbers to keep, matched by file name (seed_<n>.json)
 
         Returns:
             List of paths to seed files (relative to scenarios_dir)
@@ -157,8 +161,16 @@ class ScenarioLoader:
         else:
             search_dir = self.scenarios_dir
 
-        # Find all .json files recursively
-        seed_files = list(search_dir.rglob("*.json"))
+        if seeds is not None:
+            wanted = {f"seed_{seed}.json" for seed in seeds}
+            if scenario_type:
+                # Seeds sit directly in the type directory: stat just the wanted names
+                seed_files = [search_dir / name for name in wanted if (search_dir / name).is_file()]
+            else:
+                seed_files = [f for f in search_dir.rglob("*.json") if f.name in wanted]
+        else:
+            # Find all .json files recursively
+            seed_files = list(search_dir.rglob("*.json"))
         # Make paths relative to scenarios_dir to avoid double-prefixing
         relative_files = [f.relative_to(self.scenarios_dir) for f in seed_files]
         return sorted(relative_files)
@@ -1,11 +1,15 @@
 """Common models and utilities for QBench AgentBeats integration."""
 
 import asyncio
-import json
 import logging
+import random
+import threading
 import time
-from typing import Optional
+from collections.abc import Coroutine
+from functools import lru_cache
+from typing import Any, Optional, TypeVar
 
+import orjson
 from a2a.types import AgentCapabilities, AgentCard, AgentSkill
 from pydantic import BaseModel
 
@@ -14,6 +18,8 @@ from qbench.agent.base import Agent
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # Task instructions sent to purple agent at the start of each episode
 QBENCH_TASK_PROMPT = """
@@ -123,6 +129,28 @@ Return JSON actions for each QUEUE STATUS snapshot.
 """.strip()
 
 
+# Upper bound on the delay between agent call retries, in seconds
+MAX_RETRY_DELAY = 30.0
+
+# Fallback loop for agent calls made without a running owner loop, started on
+# first use and kept for the life of the process (daemon thread)
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting its thread if needed."""
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="qbench-a2a-loop", daemon=True
+            ).start()
+            _background_loop = loop
+        return _background_loop
+
+
 class A2AAgentWrapper(Agent):
     """
     Adapts an A2A purple agent to the qbench.Agent interface.
@@ -142,10 +170,49 @@ class A2AAgentWrapper(Agent):
         self.url = url
         self.tool_provider = tool_provider
 
+        # Loop that owns the tool provider's pooled client and queue manager.
+        # act() runs in worker threads and submits calls back to this loop
+        # instead of building a fresh one per step with asyncio.run().
+        try:
+            self._loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+
+    def _run_coroutine(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run coro to completion from synchronous code and return its result.
+
+        Prefers the owning event loop when it is running in another thread.
+        Otherwise (no owner, or called on the owner's own thread, where
+        blocking on it would deadlock) uses the shared background loop, so
+        no call pays for creating and tearing down an event loop.
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        loop = self._loop
+        if loop is None or not loop.is_running() or loop is running:
+            loop = _get_background_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
     def act(self, observation_text: str) -> str:
         """
         Send observation to purple agent via A2A and get actions response.
 
+        Args:
+            observation_text: Formatted observation from ObservationFormatter
+
+        Returns:
+            Agent's response containing actions (JSON or text format)
+        """
+        return self._run_coroutine(self.aact(observation_text))
+
+    async def aact(self, observation_text: str) -> str:
+        """
+        Async variant of act(); retries back off without blocking a thread.
+
         Args:
             observation_text: Formatted observation from ObservationFormatter
 
@@ -153,7 +220,7 @@ class A2AAgentWrapper(Agent):
             Agent's response containing actions (JSON or text format)
         """
         # Track timing for this agent call
-        start_time = time.time()
+        start_time = time.monotonic()
         logger.info(f"[TIMING] Sending request to purple agent at {self.url}")
 
         # Retry logic for agent crashes
@@ -162,54 +229,31 @@ class A2AAgentWrapper(Agent):
 
         for attempt in range(max_retries):
             try:
-                # Use asyncio to call the async tool_provider method
                 # Always use new_conversation=True for stateless operation
-                # Try to get existing event loop, otherwise create new one
-                try:
-                    loop = asyncio.get_running_loop()
-                except RuntimeError:
-                    # No event loop running, create new one
-                    loop = None
-
-                if loop is not None:
-                    # We're in an async context, need to run in executor
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(
-                            asyncio.run,
-                            self.tool_provider.talk_to_agent(
-                                message=observation_text,
-                                url=self.url,
-                                new_conversation=True
-                            )
-                        )
-                        response = future.result()
-                else:
-                    # No event loop, safe to use asyncio.run()
-                    response = asyncio.run(
-                        self.tool_provider.talk_to_agent(
-                            message=observation_text,
-                            url=self.url,
-                            new_conversation=True
-                        )
-                    )
-
-                elapsed = time.time() - start_time
+                response = await self.tool_provider.talk_to_agent(
+                    message=observation_text,
+                    url=self.url,
+                    new_conversation=True
+                )
+
+                elapsed = time.monotonic() - start_time
                 logger.info(f"[TIMING] Purple agent response received in {elapsed:.2f}s")
                 return response
 
             except Exception as e:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 logger.error(f"[ERROR] Agent call failed (attempt {attempt + 1}/{max_retries}) after {elapsed:.2f}s: {e}")
 
                 if attempt < max_retries - 1:
-                    logger.info(f"[RETRY] Waiting {retry_delay}s before retry...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
+                    # Jitter spreads out retries from episodes that failed together
+                    delay = retry_delay + random.uniform(0, retry_delay / 2)
+                    logger.info(f"[RETRY] Waiting {delay:.1f}s before retry...")
+                    await asyncio.sleep(delay)
+                    retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY)  # Exponential backoff
                 else:
                     logger.error(f"[ERROR] All {max_retries} attempts failed. Returning noop action.")
                     # Return a safe noop action as fallback
-                    return json.dumps({"type": "noop", "error": f"Agent unreachable: {str(e)}"})
+                    return orjson.dumps({"type": "noop", "error": f"Agent unreachable: {e}"}).decode()
 
 
 class QBenchMetrics(BaseModel):
@@ -225,10 +269,21 @@ class QBenchMetrics(BaseModel):
     avg_utilization: Optional[float] = None
 
 
+# Example assessment requests advertised on the evaluator's skill
+_SKILL_EXAMPLES = (
+    '''{"participants": {"agent": "http://localhost:9019"}, "config": {"max_episodes": 10, "scenario_types": ["late_burst_slack_trap"]}}''',
+    '''{"participants": {"agent": "http://localhost:9019"}, "config": {"max_episodes": 20}}''',
+    '''{"participants": {"agent": "http://localhost:9019"}, "config": {"scenario_types": ["capacity_cliff", "urgent_flood"], "max_episodes": 15}}''',
+)
+
+
+@lru_cache(maxsize=32)
 def qbench_evaluator_agent_card(name: str, url: str) -> AgentCard:
     """
     Create the agent card for the QBench evaluator.
 
+    Cached per (name, url); callers share the returned card and must not mutate it.
+
     Args:
         name: Agent name
         url: Agent's A2A endpoint URL
@@ -241,11 +296,7 @@ def qbench_evaluator_agent_card(name: str, url: str) -> AgentCard:
         name="Queue Management Agent Evaluation",
         description="Evaluates agents on online queue management tasks with dynamic load, limited capacity, and strict deadlines",
         tags=["benchmark", "queue-management", "scheduling", "resource-allocation"],
-        examples=[
-            '''{"participants": {"agent": "http://localhost:9019"}, "config": {"max_episodes": 10, "scenario_types": ["late_burst_slack_trap"]}}''',
-            '''{"participants": {"agent": "http://localhost:9019"}, "config": {"max_episodes": 20}}''',
-            '''{"participants": {"agent": "http://localhost:9019"}, "config": {"scenario_types": ["capacity_cliff", "urgent_flood"], "max_episodes": 15}}'''
-        ]
+        examples=list(_SKILL_EXAMPLES)
     )
 
     return AgentCard(
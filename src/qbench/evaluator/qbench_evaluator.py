@@ -3,9 +3,11 @@
 import argparse
 import asyncio
 import logging
+import random
 import time
 from pathlib import Path
 
+import orjson
 import uvicorn
 from dotenv import load_dotenv
 
@@ -20,7 +22,7 @@ from a2a.utils import new_agent_text_message
 from agentbeats.green_executor import GreenAgent, GreenExecutor
 from agentbeats.models import EvalRequest
 from agentbeats.tool_provider import ToolProvider
-from qbench import BenchmarkRunner, ScenarioLoader
+from qbench import BenchmarkRunner, ScenarioLoader, SeedConfig
 from qbench.config import RESULTS_DIR, DEFAULT_SEND_TASK_PROMPT
 from .qbench_common import A2AAgentWrapper, QBenchMetrics, qbench_evaluator_agent_card, QBENCH_TASK_PROMPT
 
@@ -35,6 +37,15 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("qbench_evaluator")
 
+# Seconds to collect episode progress messages before sending them to the
+# client as one status update
+PROGRESS_FLUSH_INTERVAL = 0.5
+
+# Attempts per episode, and the delay before the first retry in seconds
+# (doubled, with jitter, for each further retry)
+EPISODE_MAX_RETRIES = 3
+EPISODE_RETRY_DELAY = 2.0
+
 
 class QBenchEvaluator(GreenAgent):
     """Green agent that evaluates queue management agents using QBench."""
@@ -91,12 +102,11 @@ class QBenchEvaluator(GreenAgent):
             updater: Task updater for reporting progress
             agent_override: Optional agent instance to use instead of A2A wrapper (for standalone mode)
         """
-        import json
         from pathlib import Path
         from qbench import EpisodeRunner, QueueEnv
 
         logger.info(f"Starting QBench evaluation: {req}")
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Get configuration (backward compatible with old and new keys)
         scenario_types = req.config.get("scenario_types") or req.config.get("scenarios", None)
@@ -199,17 +209,9 @@ class QBenchEvaluator(GreenAgent):
             # Group episodes by scenario type and filter by requested seeds
             episodes_by_scenario = {}
             for scenario_type in scenario_types:
-                all_seed_files = self._loader.list_scenarios(scenario_type)
-
-                # Filter to only include requested seeds
-                filtered_seeds = []
-                for seed_path in all_seed_files:
-                    # Extract seed number from filename (e.g., "seed_1.json" -> 1)
-                    seed_num = int(seed_path.stem.split("_")[-1])
-                    if seed_num in seeds:
-                        filtered_seeds.append(seed_path)
-
-                episodes_by_scenario[scenario_type] = filtered_seeds
+                episodes_by_scenario[scenario_type] = self._loader.list_scenarios(
+                    scenario_type, seeds=seeds
+                )
 
             # Calculate total episodes
             total_episodes = sum(len(seeds) for seeds in episodes_by_scenario.values())
@@ -241,6 +243,15 @@ class QBenchEvaluator(GreenAgent):
                 for seed_path in seeds:
                     all_episodes.append((scenario_type, seed_path))
 
+            # Parse every seed and create every episode directory up front, off
+            # the loop; retries reuse the parsed config
+            configs, _ = await asyncio.gather(
+                asyncio.to_thread(
+                    self._preload_configs, [seed_path for _, seed_path in all_episodes]
+                ),
+                asyncio.to_thread(self._make_episode_dirs, runtime_dir, all_episodes),
+            )
+
             await updater.update_status(
                 TaskState.working,
                 new_agent_text_message(
@@ -249,119 +260,153 @@ class QBenchEvaluator(GreenAgent):
             )
 
             # Shared state for progress tracking
-            results_lock = asyncio.Lock()
             results = []
             counters = {"passed": 0, "failed": 0, "completed": 0}
-            episode_counter = {"current": 0}
 
-            # Semaphore to limit concurrent episodes (for new parallel mode)
-            semaphore = asyncio.Semaphore(self._parallel)
+            # Running sums of passing episodes' metrics, averaged at the end
+            metric_sums = {
+                "routine_sla": 0.0,
+                "avg_wait_time": 0.0,
+                "avg_backlog": 0.0,
+                "max_backlog": 0,
+                "avg_utilization": 0.0,
+            }
+
+            # Episode progress messages, sent in batches by flush_progress();
+            # None tells the flusher to send what is left and stop
+            progress_queue: asyncio.Queue[str | None] = asyncio.Queue()
+
+            # Updaters that drop progress text (standalone mode) opt out, so
+            # the per-episode messages are never built
+            send_progress = getattr(updater, "wants_progress", True)
+
+            async def flush_progress() -> None:
+                """Coalesce queued progress messages into one status update per interval."""
+                while True:
+                    batch = [await progress_queue.get()]
+                    if batch[0] is not None:
+                        await asyncio.sleep(PROGRESS_FLUSH_INTERVAL)
+                    while not progress_queue.empty():
+                        batch.append(progress_queue.get_nowait())
+
+                    messages = [msg for msg in batch if msg is not None]
+                    if messages:
+                        await updater.update_status(
+                            TaskState.working,
+                            new_agent_text_message("\n\n".join(messages))
+                        )
+                    if len(messages) < len(batch):
+                        return
 
             # Function to run a single episode
-            async def run_single_episode(worker_id: int, scenario_type: str, seed_path, episode_num: int):
-                """Run a single episode with retry logic."""
+            async def run_single_episode(worker_id: int, scenario_type: str, seed_path, episode_num: int, attempt: int):
+                """Run one attempt of an episode; a failed attempt is re-queued for retry."""
                 nonlocal results, counters
 
                 seed_number = seed_path.stem.split("_")[-1]
                 episode_name = f"{scenario_type}/seed_{seed_number}"
-                episode_start_time = time.time()
+                if attempt == 0:
+                    episode_start_times[episode_num] = time.monotonic()
 
-                # Use simpler episode logging format
-                logger.info(f"[Ep#{episode_num}/{total_episodes}] Starting: {episode_name}")
+                    # Use simpler episode logging format
+                    logger.info(f"[Ep#{episode_num}/{total_episodes}] Starting: {episode_name}")
 
-                # Create runtime directory for this episode
-                episode_runtime_dir = runtime_dir / scenario_type / f"seed_{seed_number}"
-                episode_runtime_dir.mkdir(parents=True, exist_ok=True)
+                # Runtime directory for this episode (created before dispatch)
+                episode_runtime_dir = self._episode_dir(runtime_dir, scenario_type, seed_path)
 
-                # Load scenario and run episode with retry logic
-                max_retries = 3
-                retry_delay = 2.0
+                # Load scenario and run episode
                 result = None
                 last_error = None
 
-                for attempt in range(max_retries):
-                    try:
-                        config = self._loader.load(seed_path)
-                        env = QueueEnv(config)
-
-                        episode_runner = EpisodeRunner(
-                            env=env,
-                            agent=agent
-                        )
+                try:
+                    config = configs.get(seed_path) or self._loader.load(seed_path)
+                    env = QueueEnv(config)
 
-                        # Run episode in thread pool to avoid blocking
-                        result = await asyncio.to_thread(
-                            episode_runner.run,
-                            scenario_type=scenario_type,
-                            seed_number=seed_number,
-                            verbose=self._verbose,
-                            runtime_dir=episode_runtime_dir
-                        )
+                    episode_runner = EpisodeRunner(
+                        env=env,
+                        agent=agent
+                    )
 
-                        # Success - break out of retry loop
-                        break
+                    # Run episode on the loop; agent calls are awaited via aact()
+                    result = await episode_runner.run_async(
+                        scenario_type=scenario_type,
+                        seed_number=seed_number,
+                        verbose=self._verbose,
+                        runtime_dir=episode_runtime_dir
+                    )
 
-                    except Exception as e:
-                        last_error = e
-                        logger.error(f"[Ep#{episode_num}/{total_episodes}] Attempt {attempt + 1}/{max_retries} failed: {e}")
+                except Exception as e:
+                    last_error = e
+                    logger.error(f"[Ep#{episode_num}/{total_episodes}] Attempt {attempt + 1}/{EPISODE_MAX_RETRIES} failed: {e}")
+
+                    if attempt < EPISODE_MAX_RETRIES - 1:
+                        # Back off without holding the worker: the episode rejoins the
+                        # back of the queue once the delay has passed. Jitter keeps
+                        # episodes that failed together from retrying in lockstep
+                        delay = EPISODE_RETRY_DELAY * 2 ** attempt * (0.5 + random.random())
+                        logger.info(f"[Ep#{episode_num}/{total_episodes}] Retrying in {delay:.1f}s...")
+                        asyncio.get_running_loop().call_later(
+                            delay,
+                            episode_queue.put_nowait,
+                            (scenario_type, seed_path, episode_num, attempt + 1),
+                        )
+                        return None
 
-                        if attempt < max_retries - 1:
-                            logger.info(f"[Ep#{episode_num}/{total_episodes}] Retrying in {retry_delay}s...")
-                            await asyncio.sleep(retry_delay)
-                            retry_delay *= 2
-                        else:
-                            logger.error(f"[Ep#{episode_num}/{total_episodes}] Failed after {max_retries} attempts")
+                    logger.error(f"[Ep#{episode_num}/{total_episodes}] Failed after {EPISODE_MAX_RETRIES} attempts")
 
                 # Process result
-                episode_duration = time.time() - episode_start_time
+                episode_duration = time.monotonic() - episode_start_times.pop(episode_num)
                 worker_result = {"passed": 0, "failed": 0, "crashed": 0}
 
-                async with results_lock:
-                    if result is not None:
-                        results.append(result)
-                        counters["completed"] += 1
-
-                        if result.passed:
-                            counters["passed"] += 1
-                            worker_result["passed"] = 1
-                            status_icon = "✓"
-                        else:
-                            counters["failed"] += 1
-                            worker_result["failed"] = 1
-                            status_icon = "✗"
-
-                        # Save episode summary
-                        summary_data = {
-                            "episode": episode_num,
-                            "total": total_episodes,
-                            "scenario_type": scenario_type,
-                            "seed_number": seed_number,
-                            "passed": result.passed,
-                            "duration_seconds": episode_duration,
-                            "metrics": result.metrics.model_dump(),
-                            "violations": [v.model_dump() for v in result.violations],
-                            "summary": result.summary
-                        }
-
-                        runtime_summary = episode_runtime_dir / "summary.json"
-                        with open(runtime_summary, 'w') as f:
-                            json.dump(summary_data, f, indent=2)
-
-                        # Log completion
-                        if result.passed:
-                            logger.info(
-                                f"[Ep#{episode_num}/{total_episodes}] ✓ PASS {episode_name} "
-                                f"({episode_duration:.1f}s) - routine_sla={result.metrics.routine_sla:.3f}, "
-                                f"wait={result.metrics.avg_wait_time:.1f}, util={result.metrics.avg_utilization:.3f}"
-                            )
-                        else:
-                            violation_types = set(v.type for v in result.violations)
-                            logger.info(
-                                f"[Ep#{episode_num}/{total_episodes}] ✗ FAIL {episode_name} "
-                                f"({episode_duration:.1f}s) - violations: {', '.join(violation_types)}"
-                            )
+                # The bookkeeping below does not await, so on the event loop each
+                # completion is processed atomically; the shared tallies need no
+                # lock. The summary file is written afterwards, off the loop.
+                if result is not None:
+                    results.append(result)
+                    counters["completed"] += 1
+
+                    if result.passed:
+                        counters["passed"] += 1
+                        for field in metric_sums:
+                            metric_sums[field] += getattr(result.metrics, field)
+                        worker_result["passed"] = 1
+                        status_icon = "✓"
+                    else:
+                        counters["failed"] += 1
+                        worker_result["failed"] = 1
+                        status_icon = "✗"
+
+                    # Save episode summary
+                    summary_data = {
+                        "episode": episode_num,
+                        "total": total_episodes,
+                        "scenario_type": scenario_type,
+                        "seed_number": seed_number,
+                        "passed": result.passed,
+                        "duration_seconds": episode_duration,
+                        "metrics": result.metrics.model_dump(),
+                        "violations": [v.model_dump() for v in result.violations],
+                        "summary": result.summary
+                    }
+
+                    summary_bytes = orjson.dumps(summary_data, option=orjson.OPT_INDENT_2)
+
+                    # Log completion
+                    if result.passed:
+                        logger.info(
+                            f"[Ep#{episode_num}/{total_episodes}] ✓ PASS {episode_name} "
+                            f"({episode_duration:.1f}s) - routine_sla={result.metrics.routine_sla:.3f}, "
+                            f"wait={result.metrics.avg_wait_time:.1f}, util={result.metrics.avg_utilization:.3f}"
+                        )
+                    else:
+                        violation_types = set(v.type for v in result.violations)
+                        logger.info(
+                            f"[Ep#{episode_num}/{total_episodes}] ✗ FAIL {episode_name} "
+                            f"({episode_duration:.1f}s) - violations: {', '.join(violation_types)}"
+                        )
 
-                        # Send progress update
+                    # Send progress update
+                    if send_progress:
                         progress_msg = (
                             f"[Worker {worker_id}] [Episode {episode_num}/{total_episodes}] {scenario_type}/seed_{seed_number}\n"
                             f"{status_icon} {'PASS' if result.passed else 'FAIL'} ({episode_duration:.1f}s)"
@@ -379,100 +424,104 @@ class QBenchEvaluator(GreenAgent):
 
                         progress_msg += f"\n\nProgress: {counters['completed']}/{total_episodes} ({100*counters['completed']/total_episodes:.1f}%) | Passed: {counters['passed']}/{counters['completed']} ({100*counters['passed']/counters['completed']:.1f}%)"
 
-                        await updater.update_status(
-                            TaskState.working,
-                            new_agent_text_message(progress_msg)
-                        )
-
-                    else:
-                        # Episode crashed after all retries
-                        counters["failed"] += 1
-                        counters["completed"] += 1
-                        worker_result["crashed"] = 1
-
-                        # Save error summary
-                        error_summary = {
-                            "episode": episode_num,
-                            "total": total_episodes,
-                            "scenario_type": scenario_type,
-                            "seed_number": seed_number,
-                            "passed": False,
-                            "duration_seconds": episode_duration,
-                            "error": str(last_error),
-                            "error_type": type(last_error).__name__,
-                            "retries_exhausted": True
-                        }
-
-                        runtime_summary = episode_runtime_dir / "summary.json"
-                        with open(runtime_summary, 'w') as f:
-                            json.dump(error_summary, f, indent=2)
-
-                        logger.error(
-                            f"[Ep#{episode_num}/{total_episodes}] ✗ CRASHED {episode_name} "
-                            f"({episode_duration:.1f}s) - {type(last_error).__name__}: {str(last_error)[:100]}"
-                        )
+                        progress_queue.put_nowait(progress_msg)
+
+                else:
+                    # Episode crashed after all retries
+                    counters["failed"] += 1
+                    counters["completed"] += 1
+                    worker_result["crashed"] = 1
+
+                    # Save error summary
+                    error_summary = {
+                        "episode": episode_num,
+                        "total": total_episodes,
+                        "scenario_type": scenario_type,
+                        "seed_number": seed_number,
+                        "passed": False,
+                        "duration_seconds": episode_duration,
+                        "error": str(last_error),
+                        "error_type": type(last_error).__name__,
+                        "retries_exhausted": True
+                    }
+
+                    summary_bytes = orjson.dumps(error_summary, option=orjson.OPT_INDENT_2)
+
+                    logger.error(
+                        f"[Ep#{episode_num}/{total_episodes}] ✗ CRASHED {episode_name} "
+                        f"({episode_duration:.1f}s) - {type(last_error).__name__}: {str(last_error)[:100]}"
+                    )
 
-                        # Send progress update
+                    # Send progress update
+                    if send_progress:
                         progress_msg = (
                             f"[Worker {worker_id}] [Episode {episode_num}/{total_episodes}] {scenario_type}/seed_{seed_number}\n"
                             f"✗ CRASHED ({episode_duration:.1f}s) - {type(last_error).__name__}: {str(last_error)[:100]}"
                         )
                         progress_msg += f"\n\nProgress: {counters['completed']}/{total_episodes} ({100*counters['completed']/total_episodes:.1f}%) | Passed: {counters['passed']}/{counters['completed']}"
 
-                        await updater.update_status(
-                            TaskState.working,
-                            new_agent_text_message(progress_msg)
-                        )
+                        progress_queue.put_nowait(progress_msg)
+
+                # The last episode to finish releases the idle workers
+                if counters["completed"] == total_episodes:
+                    for _ in range(num_workers):
+                        episode_queue.put_nowait(None)
+
+                await asyncio.to_thread(
+                    (episode_runtime_dir / "summary.json").write_bytes, summary_bytes
+                )
 
                 return worker_result
 
-            # Wrapper to assign episode numbers and run with semaphore
-            async def run_episode_with_number(scenario_type: str, seed_path):
-                """Assign episode number and run episode."""
-                # Assign episode number
-                async with results_lock:
-                    episode_counter["current"] += 1
-                    episode_num = episode_counter["current"]
+            # Episodes are numbered in launch order and handed out one at a time;
+            # retries are queued behind them, and None tells a worker to stop
+            num_workers = min(self._parallel, total_episodes)
+            episode_queue: asyncio.Queue[tuple[str, Path, int, int] | None] = asyncio.Queue()
+            for episode_num, (scenario_type, seed_path) in enumerate(all_episodes, start=1):
+                episode_queue.put_nowait((scenario_type, seed_path, episode_num, 0))
 
-                # Run episode with semaphore control (concurrency limit)
-                async with semaphore:
-                    return await run_single_episode(1, scenario_type, seed_path, episode_num)
+            # Start time of each episode's first attempt, so durations include retries
+            episode_start_times: dict[int, float] = {}
+
+            async def episode_worker(worker_id: int) -> None:
+                """Run episodes until none are left (one worker per parallel slot)."""
+                while (episode := await episode_queue.get()) is not None:
+                    await run_single_episode(worker_id, *episode)
 
             # Run all episodes with controlled parallelism
             logger.info(f"Starting {total_episodes} episodes...")
 
-            # Launch all episodes (semaphore controls concurrency)
-            await asyncio.gather(*[
-                run_episode_with_number(scenario_type, seed_path)
-                for scenario_type, seed_path in all_episodes
-            ])
-
-            evaluation_time = time.time() - start_time
+            # Only `parallel` workers exist, so at most that many episode
+            # coroutines are alive regardless of how many episodes are queued
+            flusher = asyncio.create_task(flush_progress())
+            try:
+                await asyncio.gather(*[
+                    episode_worker(worker_id)
+                    for worker_id in range(1, num_workers + 1)
+                ])
+            finally:
+                # Deliver any progress still queued before the final summary
+                progress_queue.put_nowait(None)
+                await flusher
+
+            evaluation_time = time.monotonic() - start_time
 
             # Aggregate results
             from qbench import Metrics, BenchmarkResult
 
             total = len(results)
-            passed = sum(1 for r in results if r.passed)
+            passed = counters["passed"]
             failed = total - passed
             pass_rate = passed / total if total > 0 else 0.0
 
             # Compute aggregate metrics (average of passing episodes)
-            passing_results = [r for r in results if r.passed]
-
-            if passing_results:
-                avg_routine_sla = sum(r.metrics.routine_sla for r in passing_results) / len(passing_results)
-                avg_wait = sum(r.metrics.avg_wait_time for r in passing_results) / len(passing_results)
-                avg_backlog = sum(r.metrics.avg_backlog for r in passing_results) / len(passing_results)
-                max_backlog_avg = sum(r.metrics.max_backlog for r in passing_results) / len(passing_results)
-                avg_util = sum(r.metrics.avg_utilization for r in passing_results) / len(passing_results)
-
+            if passed:
                 aggregate_metrics = Metrics(
-                    routine_sla=avg_routine_sla,
-                    avg_wait_time=avg_wait,
-                    avg_backlog=avg_backlog,
-                    max_backlog=int(max_backlog_avg),
-                    avg_utilization=avg_util
+                    routine_sla=metric_sums["routine_sla"] / passed,
+                    avg_wait_time=metric_sums["avg_wait_time"] / passed,
+                    avg_backlog=metric_sums["avg_backlog"] / passed,
+                    max_backlog=int(metric_sums["max_backlog"] / passed),
+                    avg_utilization=metric_sums["avg_utilization"] / passed
                 )
             else:
                 aggregate_metrics = None
@@ -525,12 +574,49 @@ class QBenchEvaluator(GreenAgent):
             # Cleanup
             if self._tool_provider:
                 self._tool_provider.reset()
+                await self._tool_provider.aclose()
 
             # Stop queue manager if it was started
             if queue_manager:
                 await queue_manager.stop()
                 logger.info("Rate limiter stopped")
 
+    @staticmethod
+    def _episode_dir(runtime_dir: Path, scenario_type: str, seed_path: Path) -> Path:
+        """Return the runtime directory for one episode (<type>/seed_<n>)."""
+        return runtime_dir / scenario_type / f"seed_{seed_path.stem.split('_')[-1]}"
+
+    def _make_episode_dirs(self, runtime_dir: Path, episodes: list[tuple[str, Path]]) -> None:
+        """Create the runtime directory of every episode in one pass."""
+        for scenario_type, seed_path in episodes:
+            self._episode_dir(runtime_dir, scenario_type, seed_path).mkdir(
+                parents=True, exist_ok=True
+            )
+
+    def _preload_configs(self, seed_paths: list[Path]) -> dict[Path, SeedConfig]:
+        """
+        Load and validate seed files ahead of episode dispatch.
+
+        QueueEnv never mutates its SeedConfig, so one parsed config is shared
+        by every attempt of an episode. Seeds that fail to load are left out
+        and reloaded by the episode, which reports the error as a crash.
+
+        Args:
+            seed_paths: Seed file paths to load
+
+        Returns:
+            Mapping from seed path to its validated config
+        """
+        configs = {}
+        for seed_path in seed_paths:
+            if seed_path in configs:
+                continue
+            try:
+                configs[seed_path] = self._loader.load(seed_path)
+            except Exception as e:
+                logger.warning(f"Failed to preload {seed_path}: {e}")
+        return configs
+
     def _format_summary(self, metrics: QBenchMetrics, evaluation_time: float, result) -> str:
         """
         Format evaluation results as human-readable summary.
@@ -582,6 +668,9 @@ Overall Performance:
 class StandaloneUpdater:
     """Mock updater for standalone mode that captures results instead of sending A2A updates."""
 
+    # Per-episode progress text is discarded here, so run_eval skips building it
+    wants_progress = False
+
     def __init__(self):
         """Initialize the standalone updater."""
         self.artifacts = []
@@ -643,7 +732,6 @@ async def main():
     # Check if standalone mode
     if args.standalone:
         # Standalone mode: run evaluation directly without A2A server
-        import json
         from datetime import datetime
         from pydantic import HttpUrl
 
@@ -713,8 +801,7 @@ async def main():
             "metrics": updater.final_metrics,
         }
 
-        with open(output_path, 'w') as f:
-            json.dump(result_data, f, indent=2)
+        output_path.write_bytes(orjson.dumps(result_data, option=orjson.OPT_INDENT_2))
 
         logger.info("")
         logger.info("=" * 70)
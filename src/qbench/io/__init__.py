@@ -5,8 +5,10 @@ Formatting observations for agents and parsing agent actions.
 
 from qbench.io.formatter import ObservationFormatter
 from qbench.io.parser import ActionParser
+from qbench.io.stream import read_json_stream
 
 __all__ = [
     "ObservationFormatter",
     "ActionParser",
+    "read_json_stream",
 ]
@@ -1,5 +1,7 @@
 """Observation formatter for converting observations to agent-readable text."""
 
+import orjson
+
 from qbench.data_models.observation import Observation
 
 
@@ -133,8 +135,7 @@ class ObservationFormatter:
         Returns:
             JSON string representation
         """
-        import json
-        return json.dumps({
+        return orjson.dumps({
             "time": obs.time,
             "horizon": obs.horizon,
             "capacity": obs.capacity_per_step,
@@ -163,4 +164,4 @@ class ObservationFormatter:
             ],
             "completed_this_step": obs.completed_this_step,
             "missed_this_step": obs.missed_this_step
-        }, indent=2)
+        }, option=orjson.OPT_INDENT_2).decode()
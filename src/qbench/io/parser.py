@@ -1,9 +1,9 @@
 """Action parser for converting agent responses to Action objects."""
 
-import json
 import re
 from typing import Any
 
+import orjson
 from pydantic import ValidationError
 
 from qbench.data_models.action import Action
@@ -37,7 +37,7 @@ class ActionParser:
         # Try JSON parsing first
         try:
             return self._parse_json(response)
-        except (json.JSONDecodeError, ValueError):
+        except ValueError:  # includes orjson.JSONDecodeError
             pass
 
         # Try text parsing
@@ -58,7 +58,7 @@ class ActionParser:
         - Object: {"type": "schedule", ...}
         - Object with "actions" key: {"actions": [...]}
         """
-        data = json.loads(response)
+        data = orjson.loads(response)
 
         # Handle different JSON structures
         if isinstance(data, list):
@@ -81,7 +81,7 @@ class ActionParser:
             except ValidationError as e:
                 raise ValueError(f"Invalid action format: {e}")
 
-        return actions if actions else [Action(type="noop")]
+        return actions if actions else [Action.model_construct(type="noop")]
 
     def _parse_text(self, response: str) -> list[Action]:
         """
@@ -109,13 +109,13 @@ class ActionParser:
             if action:
                 actions.append(action)
 
-        return actions if actions else [Action(type="noop")]
+        return actions if actions else [Action.model_construct(type="noop")]
 
     def _parse_text_line(self, line: str) -> Action | None:
         """Parse a single line of text into an Action."""
         # Noop
         if "noop" in line or "no-op" in line or "nothing" in line:
-            return Action(type="noop")
+            return Action.model_construct(type="noop")
 
         # Schedule: "schedule t1 at step 5" or "schedule t1 5"
         match = re.search(
@@ -125,7 +125,7 @@ class ActionParser:
         if match:
             task_id = match.group(1)
             step = int(match.group(2))
-            return Action(type="schedule", task_id=task_id, step=step)
+            return Action.model_construct(type="schedule", task_id=task_id, step=step)
 
         # Reschedule: "reschedule t1 to step 7" or "reschedule t1 7"
         match = re.search(
@@ -135,19 +135,19 @@ class ActionParser:
         if match:
             task_id = match.group(1)
             step = int(match.group(2))
-            return Action(type="reschedule", task_id=task_id, step=step)
+            return Action.model_construct(type="reschedule", task_id=task_id, step=step)
 
         # Reject: "reject t2"
         match = re.search(r"reject\s+(\S+)", line)
         if match:
             task_id = match.group(1)
-            return Action(type="reject", task_id=task_id)
+            return Action.model_construct(type="reject", task_id=task_id)
 
         # Cancel: "cancel t3"
         match = re.search(r"cancel\s+(\S+)", line)
         if match:
             task_id = match.group(1)
-            return Action(type="cancel", task_id=task_id)
+            return Action.model_construct(type="cancel", task_id=task_id)
 
         # If no match, ignore this line
         return None
@@ -168,4 +168,4 @@ class ActionParser:
             return self.parse(response)
         except (ValueError, Exception):
             # If parsing fails, return noop
-            return [Action(type="noop")]
+            return [Action.model_construct(type="noop")]
@@ -0,0 +1,42 @@
+"""Reader for streamed LLM completions used by example agents."""
+
+from collections.abc import Iterable
+from typing import Any
+
+import orjson
+
+
+def read_json_stream(chunks: Iterable[Any]) -> str:
+    """
+    Accumulate a streamed completion, stopping once a complete JSON value has arrived.
+
+    Text responses run to the end of the stream. The stream is closed when
+    reading stops, so an early break releases the rest of the response.
+
+    Args:
+        chunks: Streaming response, e.g. from litellm.completion(stream=True)
+
+    Returns:
+        Concatenated response text
+    """
+    buffer = ""
+    try:
+        for chunk in chunks:
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            buffer += delta
+
+            # Only JSON responses can end early, and only on a closing bracket
+            if buffer.lstrip()[:1] in ("{", "[") and delta.rstrip()[-1:] in ("}", "]"):
+                try:
+                    orjson.loads(buffer)
+                except orjson.JSONDecodeError:
+                    continue
+                break
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+    return buffer
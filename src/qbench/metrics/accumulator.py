@@ -85,7 +85,7 @@ class MetricsAccumulator:
         This is called at the end of episode to compute actual utilization.
 
         Args:
-            schedule: dict[int, list[str]] mapping step -> task_ids
+            schedule: dict[int, dict[str, None]] mapping step -> task_ids
             horizon: Total episode length
             capacity: Capacity per step
         """
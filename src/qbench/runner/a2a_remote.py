@@ -13,7 +13,7 @@ from qbench.runner.utils import (
     format_results_summary,
     save_results_to_file,
 )
-from qbench.client.a2a_client import send_eval_request, get_agent_info
+from qbench.client.a2a_client import aclose_client, send_eval_request, get_agent_info
 
 logger = logging.getLogger("qbench.runner.a2a_remote")
 
@@ -85,37 +85,43 @@ async def run_a2a_remote_evaluation(
             print(f"Parallel:     {parallel}")
             print(f"{'='*70}\n")
 
-        # Step 1: Check if purple agent is running
+        # Step 1: Start green agent (it boots while the purple agent is probed)
         if not quiet:
-            print("Step 1/5: Checking purple agent...")
+            print("Step 1/5: Starting green agent...")
+
+        green_process = start_green_agent_subprocess(
+            port=green_agent_port,
+            scenarios_dir=scenarios_dir,
+            parallel=parallel,
+            verbose=verbose
+        )
+
+        # Wait for the green agent in the background while the purple agent is probed
+        green_ready = asyncio.create_task(wait_for_agent(green_agent_url, timeout=30))
+
+        # Step 2: Check purple agent
+        if not quiet:
+            print("Step 2/5: Checking purple agent...")
 
         purple_info = await get_agent_info(purple_agent_url)
+
         if purple_info:
             if not quiet:
                 print(f"  ✓ Purple agent ready: {purple_info.get('name', 'Unknown')}")
         else:
+            green_ready.cancel()
             raise Exception(
                 f"Purple agent not responding at {purple_agent_url}\n"
                 f"Make sure your agent is running first:\n"
                 f"  python my_purple_agent.py --port {purple_agent_url.split(':')[-1]}"
             )
 
-        # Step 2: Start green agent
-        if not quiet:
-            print("Step 2/5: Starting green agent...")
-
-        green_process = start_green_agent_subprocess(
-            port=green_agent_port,
-            scenarios_dir=scenarios_dir,
-            parallel=parallel,
-            verbose=verbose
-        )
-
-        # Step 3: Wait for green agent to be ready
+        # Step 3: Wait for green agent
         if not quiet:
             print("Step 3/5: Waiting for green agent to be ready...")
 
-        ready = await wait_for_agent(green_agent_url, timeout=30)
+        ready = await green_ready
+
         if not ready:
             raise Exception("Green agent failed to start")
 
@@ -166,6 +172,9 @@ async def run_a2a_remote_evaluation(
         raise
 
     finally:
+        # Release pooled connections before the event loop closes
+        await aclose_client()
+
         # Clean up: shut down green agent
         if green_process and green_process.poll() is None:
             if not quiet:
@@ -1,8 +1,14 @@
 """Episode runner for executing single episodes in QBench."""
 
+import asyncio
 import time
+from pathlib import Path
+from typing import Any
+
+import orjson
 
 from qbench.agent.base import Agent
+from qbench.data_models.observation import Observation
 from qbench.data_models.result import EpisodeResult, Metrics
 from qbench.data_models.violation import Violation
 from qbench.environment.env import QueueEnv
@@ -69,7 +75,7 @@ class EpisodeRunner:
         scenario_type: str | None = None,
         seed_number: str | None = None,
         verbose: bool = False,
-        runtime_dir: str | None = None
+        runtime_dir: str | Path | None = None
     ) -> EpisodeResult:
         """
         Run a complete episode.
@@ -83,10 +89,7 @@ class EpisodeRunner:
         Returns:
             EpisodeResult with PASS/FAIL status, violations, and metrics
         """
-        import json
-        from pathlib import Path
-
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Reset environment
         obs = self.env.reset()
@@ -96,108 +99,239 @@ class EpisodeRunner:
         step_count = 0
 
         # Track steps for logging
-        step_logs = [] if runtime_dir else None
+        step_logs: list[dict[str, Any]] | None = [] if runtime_dir else None
 
         while not done:
-            if verbose:
-                print(f"Step {obs.time}/{obs.horizon}...", end=" ")
+            obs_text = self._prompt(obs, verbose)
+
+            # Get agent actions
+            response = ""
+            error = None
+            try:
+                response = self.agent.act(obs_text)
+            except Exception as e:
+                error = e
+
+            obs, done = self._step(obs, obs_text, response, error, step_logs, verbose)
+            step_count += 1
+
+        result = self._result(scenario_type, seed_number, step_count, start_time, verbose)
+
+        # Save step logs if runtime_dir provided
+        if runtime_dir and step_logs:
+            self._save_step_logs(runtime_dir, scenario_type, seed_number, step_count, step_logs)
+
+        return result
+
+    async def run_async(
+        self,
+        scenario_type: str | None = None,
+        seed_number: str | None = None,
+        verbose: bool = False,
+        runtime_dir: str | Path | None = None
+    ) -> EpisodeResult:
+        """
+        Run a complete episode on the event loop, awaiting agent.aact().
+
+        Same contract as run(). Agents with native async I/O (such as the
+        A2A wrapper) let concurrent episodes share one loop without a worker
+        thread each; other agents fall back to Agent.aact()'s thread offload.
+
+        Args:
+            scenario_type: Optional scenario type identifier
+            seed_number: Optional seed number identifier
+            verbose: If True, print progress
+            runtime_dir: Optional directory to save step-by-step logs
+
+        Returns:
+            EpisodeResult with PASS/FAIL status, violations, and metrics
+        """
+        start_time = time.monotonic()
+
+        obs = self.env.reset()
 
-            # 1. Format observation for agent
-            obs_text = self.formatter.format(obs)
+        done = False
+        step_count = 0
+        step_logs: list[dict[str, Any]] | None = [] if runtime_dir else None
 
-            # Prepend task instructions on every step (for stateless A2A agents)
-            if QBENCH_TASK_PROMPT is not None:
-                obs_text = QBENCH_TASK_PROMPT + "\n\n" + obs_text
+        while not done:
+            obs_text = self._prompt(obs, verbose)
 
-            # 2. Get agent actions
             response = ""
-            actions = []
-            step_violations = []
+            error = None
+            try:
+                response = await self.agent.aact(obs_text)
+            except Exception as e:
+                error = e
+
+            obs, done = self._step(obs, obs_text, response, error, step_logs, verbose)
+            step_count += 1
+
+        result = self._result(scenario_type, seed_number, step_count, start_time, verbose)
+
+        # Step logs can be large; write them off the loop
+        if runtime_dir and step_logs:
+            await asyncio.to_thread(
+                self._save_step_logs, runtime_dir, scenario_type, seed_number, step_count, step_logs
+            )
+
+        return result
+
+    def _prompt(self, obs: Observation, verbose: bool) -> str:
+        """Format the observation (with task instructions) for the agent."""
+        if verbose:
+            print(f"Step {obs.time}/{obs.horizon}...", end=" ")
+
+        # 1. Format observation for agent
+        obs_text = self.formatter.format(obs)
+
+        # Prepend task instructions on every step (for stateless A2A agents)
+        if QBENCH_TASK_PROMPT is not None:
+            obs_text = QBENCH_TASK_PROMPT + "\n\n" + obs_text
+
+        return obs_text
+
+    def _step(
+        self,
+        obs: Observation,
+        obs_text: str,
+        response: str,
+        error: Exception | None,
+        step_logs: list[dict[str, Any]] | None,
+        verbose: bool
+    ) -> tuple[Observation, bool]:
+        """
+        Apply one agent response to the environment and advance it a step.
+
+        Args:
+            obs: Observation the agent responded to
+            obs_text: Text sent to the agent
+            response: Agent response ("" if the agent call failed)
+            error: Exception raised by the agent call, if any
+            step_logs: Step log list to append to (None disables logging)
+            verbose: If True, print progress
+
+        Returns:
+            Tuple of (next_observation, done)
+        """
+        # 2. Parse agent actions
+        actions = []
+        step_violations = []
+        if error is None:
             try:
-                response = self.agent.act(obs_text)
                 actions = self.parser.parse(response)
             except Exception as e:
-                # If agent crashes or returns unparseable response, treat as invalid action
-                violation = Violation(
-                    time=obs.time,
-                    type="invalid_action",
-                    details={"reason": "agent_error", "error": str(e)}
-                )
+                error = e
+        if error is not None:
+            # If agent crashes or returns unparseable response, treat as invalid action
+            error_violation = Violation(
+                time=obs.time,
+                type="invalid_action",
+                details={"reason": "agent_error", "error": str(error)}
+            )
+            self.violations.append(error_violation)
+            step_violations.append(error_violation)
+            self.failed = True
+            actions = []  # Continue with no actions
+
+        # 3. Validate and apply actions
+        for action in actions:
+            env_state = self._get_env_state()
+            is_valid, violation = self.validator.validate(
+                action, env_state, obs.time
+            )
+
+            if not is_valid:
+                # Record violation
                 self.violations.append(violation)
                 step_violations.append(violation)
                 self.failed = True
-                actions = []  # Continue with no actions
-
-            # 3. Validate and apply actions
-            for action in actions:
-                env_state = self._get_env_state()
-                is_valid, violation = self.validator.validate(
-                    action, env_state, obs.time
-                )
-
-                if not is_valid:
-                    # Record violation
-                    self.violations.append(violation)
-                    step_violations.append(violation)
-                    self.failed = True
-                    if verbose:
-                        print(f"VIOLATION: {violation}")
-                else:
-                    # Apply action to environment
-                    self.env._apply_action(action)
-
-            # 4. Check hard constraints
-            env_state = self._get_env_state()
-            constraint_violations = self.checker.check(env_state, obs.time)
-            if constraint_violations:
-                self.violations.extend(constraint_violations)
-                step_violations.extend(constraint_violations)
-                self.failed = True
                 if verbose:
-                    for v in constraint_violations:
-                        print(f"VIOLATION: {v}")
-
-            # 5. Log step data (if runtime_dir provided)
-            if step_logs is not None:
-                step_log = {
-                    "step": obs.time,
-                    "observation": obs_text,
-                    "agent_response": response,
-                    "parsed_actions": [
-                        {
-                            "type": action.type,
-                            "task_id": getattr(action, 'task_id', None),
-                            "step": getattr(action, 'step', None),
-                            "slot_index": getattr(action, 'slot_index', None)
-                        }
-                        for action in actions
-                    ],
-                    "violations": [v.model_dump() for v in step_violations],
-                    "state_after": {
-                        "pending_count": len(self.env.pending),
-                        "scheduled_count": len(self.env.scheduled),
-                        "completed_count": len(self.env.completed),
-                        "missed_count": len(self.env.missed),
-                        "rejected_count": len(self.env.rejected)
+                    print(f"VIOLATION: {violation}")
+            else:
+                # Apply action to environment
+                self.env._apply_action(action)
+
+        # 4. Check hard constraints
+        env_state = self._get_env_state()
+        constraint_violations = self.checker.check(env_state, obs.time)
+        if constraint_violations:
+            self.violations.extend(constraint_violations)
+            step_violations.extend(constraint_violations)
+            self.failed = True
+            if verbose:
+                for v in constraint_violations:
+                    print(f"VIOLATION: {v}")
+
+        # 5. Log step data (if runtime_dir provided)
+        if step_logs is not None:
+            step_log = {
+                "step": obs.time,
+                "observation": obs_text,
+                "agent_response": response,
+                "parsed_actions": [
+                    {
+                        "type": action.type,
+                        "task_id": getattr(action, 'task_id', None),
+                        "step": getattr(action, 'step', None),
+                        "slot_index": getattr(action, 'slot_index', None)
                     }
+                    for action in actions
+                ],
+                "violations": [v.model_dump() for v in step_violations],
+                "state_after": {
+                    "pending_count": len(self.env.pending),
+                    "scheduled_count": len(self.env.scheduled),
+                    "completed_count": len(self.env.completed),
+                    "missed_count": len(self.env.missed),
+                    "rejected_count": len(self.env.rejected)
                 }
-                step_logs.append(step_log)
+            }
+            step_logs.append(step_log)
 
-            # 6. Record metrics for this step
-            self.metrics.record_step(
-                pending_count=len(self.env.pending),
-                scheduled_count=len(self.env.scheduled),
-                capacity=self.env.capacity_per_step
-            )
+        # 6. Record metrics for this step
+        self.metrics.record_step(
+            pending_count=len(self.env.pending),
+            scheduled_count=len(self.env.scheduled),
+            capacity=self.env.capacity_per_step
+        )
 
-            # 7. Step environment
-            obs, done = self.env.act([])  # Actions already applied
+        # 7. Step environment
+        next_obs, done = self.env.act([])  # Actions already applied
 
-            step_count += 1
+        if verbose:
+            print(f"OK" if not self.failed else f"FAILED")
 
-            if verbose:
-                print(f"OK" if not self.failed else f"FAILED")
+        return next_obs, done
+
+    def _save_step_logs(
+        self,
+        runtime_dir: str | Path,
+        scenario_type: str | None,
+        seed_number: str | None,
+        step_count: int,
+        step_logs: list[dict[str, Any]]
+    ) -> None:
+        """Write the episode's step-by-step log to runtime_dir/steps.json."""
+        steps_file = Path(runtime_dir) / "steps.json"
+        steps_data = {
+            "scenario_type": scenario_type,
+            "seed_number": seed_number,
+            "total_steps": step_count,
+            "passed": not self.failed,
+            "steps": step_logs
+        }
+        steps_file.write_bytes(orjson.dumps(steps_data, option=orjson.OPT_INDENT_2))
 
+    def _result(
+        self,
+        scenario_type: str | None,
+        seed_number: str | None,
+        step_count: int,
+        start_time: float,
+        verbose: bool
+    ) -> EpisodeResult:
+        """Finalize metrics and build the EpisodeResult for a finished episode."""
         # Finalize metrics
         final_metrics = self.metrics.finalize(
             schedule=self.env.schedule,
@@ -216,21 +350,7 @@ class EpisodeRunner:
             "steps": step_count
         }
 
-        execution_time = time.time() - start_time
-
-        # Save step logs if runtime_dir provided
-        if runtime_dir and step_logs:
-            runtime_path = Path(runtime_dir)
-            steps_file = runtime_path / "steps.json"
-            steps_data = {
-                "scenario_type": scenario_type,
-                "seed_number": seed_number,
-                "total_steps": step_count,
-                "passed": not self.failed,
-                "steps": step_logs
-            }
-            with open(steps_file, 'w') as f:
-                json.dump(steps_data, f, indent=2)
+        execution_time = time.monotonic() - start_time
 
         # Create result
         result = EpisodeResult(
@@ -260,6 +380,7 @@ class EpisodeRunner:
             "pending": self.env.pending,
             "scheduled": self.env.scheduled,
             "schedule": self.env.schedule,
+            "id_index": self.env.id_index,
             "capacity_per_step": self.env.capacity_per_step,
             "horizon": self.env.horizon
         }
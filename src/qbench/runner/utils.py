@@ -1,10 +1,12 @@
 """Utility functions for QBench runners."""
 
 import asyncio
+import os
 import subprocess
 import time
+from collections.abc import Mapping
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 import logging
 
 logger = logging.getLogger("qbench.runner.utils")
@@ -42,11 +44,13 @@ def parse_scenarios(
         >>> parse_scenarios("1-3,10", Path("scenarios"))
         ['scenario_001', 'scenario_002', 'scenario_003', 'scenario_010']
     """
-    # Get all scenario directories
-    all_scenarios = sorted([
-        d.name for d in scenarios_dir.iterdir()
-        if d.is_dir() and not d.name.startswith('.')
-    ])
+    # Get all scenario directories (scandir entries answer is_dir() from the
+    # directory listing itself, without a stat per entry)
+    with os.scandir(scenarios_dir) as entries:
+        all_scenarios = sorted([
+            d.name for d in entries
+            if d.is_dir() and not d.name.startswith('.')
+        ])
 
     if scenarios_arg is None or scenarios_arg == "all":
         return all_scenarios
@@ -98,7 +102,8 @@ def parse_scenarios(
                 selected.append(part)
             else:
                 # Try to find by partial name match
-                matches = [s for s in all_scenarios if part.lower() in s.lower()]
+                needle = part.lower()
+                matches = [s for s in all_scenarios if needle in s.lower()]
                 if len(matches) == 1:
                     selected.append(matches[0])
                 elif len(matches) > 1:
@@ -195,10 +200,10 @@ async def wait_for_agent(url: str, timeout: int = 30) -> bool:
         ) from e
 
     logger.info(f"Waiting for agent at {url} to be ready...")
-    start_time = time.time()
+    start_time = time.monotonic()
 
     async with httpx.AsyncClient(timeout=2.0) as client:
-        while time.time() - start_time < timeout:
+        while time.monotonic() - start_time < timeout:
             try:
                 resolver = A2ACardResolver(httpx_client=client, base_url=url)
                 card = await resolver.get_agent_card()
@@ -255,7 +260,7 @@ def start_green_agent_subprocess(port: int, scenarios_dir: str, parallel: int, v
     return process
 
 
-def format_results_summary(results: dict, verbose: bool = False) -> str:
+def format_results_summary(results: Mapping[str, Any], verbose: bool = False) -> str:
     """
     Format evaluation results as a readable summary.
 
@@ -1,5 +1,7 @@
 """Constraint checker for hard constraints in QBench."""
 
+from itertools import chain
+
 from qbench.data_models.violation import Violation
 
 
@@ -24,7 +26,7 @@ class ConstraintChecker:
                 - tasks: dict[str, Task]
                 - pending: set[str]
                 - scheduled: set[str]
-                - schedule: dict[int, list[str]]
+                - schedule: dict[int, dict[str, None]] (insertion-ordered task IDs)
                 - capacity_per_step: int
             current_time: Current time step
 
@@ -62,8 +64,9 @@ class ConstraintChecker:
         pending = env_state["pending"]
         scheduled = env_state["scheduled"]
 
-        # Check all pending and scheduled tasks
-        for uid in pending | scheduled:
+        # Check all pending and scheduled tasks (chained; the sets are
+        # disjoint, so there is no need to build their union every step)
+        for uid in chain(pending, scheduled):
             task = tasks[uid]
 
             # Only check urgent tasks
@@ -111,7 +114,7 @@ class ConstraintChecker:
                         "step": step,
                         "scheduled_count": len(task_ids),
                         "capacity": capacity,
-                        "task_ids": task_ids
+                        "task_ids": list(task_ids)
                     }
                 ))
 
@@ -5,7 +5,10 @@ from qbench.data_models.violation import Violation
 
 
 def find_task_by_id(
-    task_id: str, tasks: dict, status_set: set | None = None
+    task_id: str,
+    tasks: dict,
+    status_set: set | None = None,
+    id_index: dict[str, list[str]] | None = None
 ) -> tuple[object | None, str | None]:
     """
     Find first task with given original ID (FIFO if duplicates exist).
@@ -14,10 +17,18 @@ def find_task_by_id(
         task_id: Original task ID (what agent sees)
         tasks: Dictionary of tasks keyed by _uid
         status_set: Optional set of UIDs to search in
+        id_index: Optional original ID -> UIDs (arrival order) map; avoids
+            scanning every task when available
 
     Returns:
         (task, uid) if found, (None, None) otherwise
     """
+    if id_index is not None:
+        for uid in id_index.get(task_id, ()):
+            if status_set is None or uid in status_set:
+                return tasks[uid], uid
+        return None, None
+
     search_space = status_set if status_set is not None else tasks.keys()
 
     for uid in search_space:
@@ -50,9 +61,10 @@ class ActionValidator:
                 - tasks: dict[str, Task]
                 - pending: set[str]
                 - scheduled: set[str]
-                - schedule: dict[int, list[str]]
+                - schedule: dict[int, dict[str, None]] (insertion-ordered task IDs)
                 - capacity_per_step: int
                 - horizon: int
+                - id_index: dict[str, list[str]] (optional)
             current_time: Current time step
 
         Returns:
@@ -80,7 +92,7 @@ class ActionValidator:
         horizon = env_state["horizon"]
 
         # Find task by original ID (FIFO if duplicates)
-        task, uid = find_task_by_id(task_id, tasks)
+        task, uid = find_task_by_id(task_id, tasks, id_index=env_state.get("id_index"))
 
         # Check task exists
         if not task or not uid:
@@ -236,3 +236,54 @@ def test_env_state_summary(simple_config):
     assert summary["scheduled"] == 0
     assert summary["completed"] == 0
     assert summary["total_tasks"] == 2
+
+
+def test_env_observe_reuses_unchanged_observation(simple_config):
+    """Test observe() returns the cached observation until state changes."""
+    env = QueueEnv(simple_config)
+    obs = env.reset()
+    assert env.observe() is obs
+
+    next_obs, _ = env.act([Action(type="noop")])
+    assert next_obs is not obs
+    assert env.observe() is next_obs
+
+
+def test_env_observe_after_direct_apply_action(simple_config):
+    """Test observe() reflects actions applied outside act()."""
+    env = QueueEnv(simple_config)
+    obs = env.reset()
+
+    env._apply_action(Action(type="schedule", task_id="u1", step=1))
+    after_schedule = env.observe()
+    assert after_schedule is not obs
+    assert [t.id for t in after_schedule.pending] == ["r1"]
+    assert [(s.task.id, s.slot) for s in after_schedule.scheduled] == [("u1", 1)]
+
+    env._apply_action(Action(type="reschedule", task_id="u1", step=2))
+    after_reschedule = env.observe()
+    assert after_reschedule is not after_schedule
+    assert [(s.task.id, s.slot) for s in after_reschedule.scheduled] == [("u1", 2)]
+
+
+def test_env_find_task_duplicate_ids():
+    """Test duplicate task IDs resolve FIFO, optionally within a status set."""
+    arrival = {"id": "d1", "priority": "routine", "deadline": 8}
+    config = SeedConfig(
+        horizon=10,
+        capacity_per_step=2,
+        events={
+            "0": [{"type": "arrival", "task": {**arrival, "arrival_time": 0}}],
+            "1": [{"type": "arrival", "task": {**arrival, "arrival_time": 1}}],
+        },
+    )
+    env = QueueEnv(config)
+    env.reset()
+    first = env.get_uid("d1")
+    env.act([Action(type="schedule", task_id="d1", step=1)])
+
+    second = env.get_uid("d1", env.pending)
+    assert second is not None and second != first
+    assert env.get_uid("d1") == first  # FIFO across all tasks
+    assert env.get_uid("d1", env.scheduled) == first
+    assert env.get_uid("missing") is None
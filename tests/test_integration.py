@@ -1,12 +1,15 @@
 """Integration tests using actual scenarios from QBench-suite."""
 
+import asyncio
 from pathlib import Path
 
 import pytest
 
+from qbench.agent.base import GreedyAgent
 from qbench.data_models.action import Action
 from qbench.environment.env import QueueEnv
 from qbench.environment.loader import ScenarioLoader
+from qbench.runner.episode import EpisodeRunner
 
 
 @pytest.fixture
@@ -101,6 +104,22 @@ def test_run_late_burst_scenario(scenarios_path):
     assert "routine" in priorities
 
 
+def test_run_async_matches_run(scenarios_path):
+    """Test the async episode loop produces the same result as the sync one."""
+    loader = ScenarioLoader(scenarios_path)
+    config = loader.load("late_burst_slack_trap/seed_1.json")
+
+    sync_result = EpisodeRunner(QueueEnv(config), GreedyAgent()).run()
+    async_result = asyncio.run(
+        EpisodeRunner(QueueEnv(config), GreedyAgent()).run_async()
+    )
+
+    assert async_result.passed == sync_result.passed
+    assert async_result.summary == sync_result.summary
+    assert async_result.metrics == sync_result.metrics
+    assert async_result.violations == sync_result.violations
+
+
 def test_list_all_scenarios(scenarios_path):
     """Test that we can list all scenario types."""
     loader = ScenarioLoader(scenarios_path)
@@ -175,3 +175,8 @@ def test_list_scenarios():
 
         assert len(seeds) == 3
         assert all(s.suffix == ".json" for s in seeds)
+
+        # Filter by seed number, with and without a scenario type
+        expected = [Path("test_scenario/seed_1.json"), Path("test_scenario/seed_3.json")]
+        assert loader.list_scenarios("test_scenario", seeds=[3, 1, 7]) == expected
+        assert loader.list_scenarios(seeds={1, 3}) == expected